@@ -1,15 +1,22 @@
 import os
 import sys
-import joblib
+import time
+import asyncio
+import multiprocessing
 import numpy as np
-import pandas as pd
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 from src.config import Config
 from fastapi import FastAPI, HTTPException
-from sklearn.metrics import accuracy_score
-from src.models.train_model import train_svm_models, predict_candidate
-from src.data.generate_data import generate_candidate_data, save_data
+from fastapi.responses import PlainTextResponse
+from src import metrics
+from src.api.jobs import JobRegistry
+from src.api.cache import PredictionCache
+from src.api.batching import MicroBatcher
+from src.models import registry
+from src.models.bundle import load_bundle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Proje kök dizinini Python path'ine ekle
 # sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -20,9 +27,69 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# Model ve scaler'ı global olarak tut
-model = None
-scaler = None
+REQUEST_SECONDS = metrics.histogram(
+    'http_request_duration_seconds', 'İsteğin toplam süresi (ayrıştırma ve serileştirme dahil)')
+PREDICT_STAGE_SECONDS = metrics.histogram(
+    'predict_stage_seconds', '/predict ve /predict/batch gövdesindeki aşamaların süreleri')
+PREDICTIONS = metrics.counter('predictions_total', 'Değerlendirilen aday sayısı')
+TRAINING_JOBS = metrics.counter('training_jobs_total', 'Biten eğitim işleri')
+PREDICTION_CACHE = metrics.gauge('prediction_cache', 'Tahmin önbelleği sayaçları')
+
+
+class RequestTimer:
+    """
+    Her HTTP isteğinin toplam süresini ölçen saf ASGI ara katmanı.
+
+    BaseHTTPMiddleware'e göre ek görev ya da akış sarmalayıcısı oluşturmaz.
+    Yol etiketi olarak eşleşen route şablonu kullanılır (/train/{job_id}).
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+        started = time.perf_counter()
+        status = [500]
+
+        async def send_with_status(message):
+            if message['type'] == 'http.response.start':
+                status[0] = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get('route')
+            REQUEST_SECONDS.observe(time.perf_counter() - started, method=scope['method'],
+                                    path=getattr(route, 'path', 'unmatched'), status=status[0])
+
+if Config.METRICS:
+    app.add_middleware(RequestTimer)
+
+# Model ve scaler tek bir değiştirilemez ModelBundle içinde tutulur ve
+# yeni model tek atama ile yayınlanır (yarım güncellenmiş durum görülmez)
+bundle = None
+
+# Tekrarlanan (tecrübe, puan) çiftleri için sürüme bağlı sonuç önbelleği
+prediction_cache = PredictionCache(Config.PREDICTION_CACHE_SIZE, Config.PREDICTION_CACHE_TTL,
+                                   Config.PREDICTION_CACHE_DECIMALS)
+
+# Eğitim işleri; aynı anda tek eğitim çalışır, diğerleri sırada bekler
+jobs = JobRegistry(store_dir=Config.PROJECT_ROOT / 'data/jobs')
+training_lock = None
+_background_tasks = set()
+
+# Etkin model işaretçisinin son görülen değişiklik zamanı ve izleyici görevi
+_active_model_mtime = None
+_model_watcher = None
+
+# CPU yoğun işler event loop'u bloklamasın diye havuzlarda çalıştırılır:
+# çıkarım sınırlı bir thread havuzunda, eğitim ayrı bir süreçte
+inference_executor = None
+training_executor = None
+# Config.MICRO_BATCH açıksa tekil /predict çağrılarını toplu skorlayan zamanlayıcı
+micro_batcher = None
 
 class CandidateInput(BaseModel):
     tecrube_yili: float
@@ -33,36 +100,123 @@ class CandidateResponse(BaseModel):
     result: str
     confidence: float
 
-class TrainingResponse(BaseModel):
-    message: str
-    accuracy: Optional[float] = None
+class CandidateBatchInput(BaseModel):
+    # Satır bazlı (candidates) ya da sütun bazlı (tecrube_yili + teknik_puan) gönderilebilir
+    candidates: Optional[List[CandidateInput]] = None
+    tecrube_yili: Optional[List[float]] = None
+    teknik_puan: Optional[List[float]] = None
+
+class BatchPredictionItem(BaseModel):
+    index: int
+    prediction: Optional[int] = None
+    result: Optional[str] = None
+    confidence: Optional[float] = None
+    error: Optional[str] = None
+
+class BatchPredictionResponse(BaseModel):
+    results: List[BatchPredictionItem]
+    n_valid: int
+    n_invalid: int
+
+class TrainingJobResponse(BaseModel):
+    job_id: str
+    status: str
+    stage: str
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    elapsed_seconds: float
+    metrics: Optional[dict] = None
+    model_version: Optional[str] = None
+    error: Optional[str] = None
+
+def _new_training_executor():
+    # Eğitim süreci 'spawn' ile başlatılır; thread'ler varken fork güvenli değildir
+    return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
 
 @app.on_event("startup")
 async def startup_event():
-    global model, scaler
+    global bundle, inference_executor, training_executor, training_lock, micro_batcher
+    inference_executor = ThreadPoolExecutor(max_workers=Config.INFERENCE_WORKERS,
+                                            thread_name_prefix="inference")
+    micro_batcher = MicroBatcher(Config.MICRO_BATCH_MAX_SIZE, Config.MICRO_BATCH_MAX_WAIT_MS / 1000,
+                                 inference_executor) if Config.MICRO_BATCH else None
+    training_executor = _new_training_executor()
+    training_lock = asyncio.Lock()
     # Veri dizinini oluştur
     os.makedirs(Config.PROJECT_ROOT / 'data', exist_ok=True)
     print("📌 Startup event başladı...")
 
-    model_path = Config.PROJECT_ROOT / 'data/best_model_linear.joblib'
-    # Eğer model dosyası yoksa, yeni model oluştur
-    if not os.path.exists(Config.PROJECT_ROOT / 'data/best_model_linear.joblib'):
-        # Veri oluştur
-        data = generate_candidate_data()
-        save_data(data)
-
-        # Modeli eğit
-        from src.models.train_model import load_and_preprocess_data
-        X_train, X_test, y_train, y_test, scaler = load_and_preprocess_data()
-        model = train_svm_models(X_train, y_train)
-
-        # Modeli kaydet
-        joblib.dump((model, scaler), model_path)
-        print("✅ Model ---------------------")
-    else:
-        # Kayıtlı modeli yükle
-        model, scaler = joblib.load(model_path)
-        print("✅ Model yüklendi ------------------.")
+    # Açılışta eğitim yapılmaz. Öncelik: MODEL_PATH, kayıt defterindeki etkin model,
+    # data/best_model_linear.joblib, DEFAULT_MODEL_PATH; hiçbiri yoksa hata verilir
+    global _active_model_mtime, _model_watcher
+    active, _active_model_mtime = registry.read_active_model()
+    model_path = Config.MODEL_PATH
+    if model_path is None and active is not None and os.path.exists(active['path']):
+        bundle = _load_active(active)
+        print(f"✅ Etkin model yüklendi ({bundle.kernel}, sürüm {bundle.version}).")
+        prediction_cache.clear()
+        _model_watcher = asyncio.create_task(_watch_active_model())
+        return
+    if model_path is None:
+        model_path = Config.PROJECT_ROOT / 'data/best_model_linear.joblib'
+    if not os.path.exists(model_path) and Config.DEFAULT_MODEL_PATH:
+        print(f"⚠️ Model bulunamadı ({model_path}), varsayılan model yükleniyor: {Config.DEFAULT_MODEL_PATH}")
+        model_path = Config.DEFAULT_MODEL_PATH
+    if not os.path.exists(model_path):
+        raise RuntimeError(
+            f"Model dosyası bulunamadı: {model_path}. "
+            "Önce 'python -m src.models.train_model' ile bir model eğitin ya da MODEL_PATH/DEFAULT_MODEL_PATH ayarlayın."
+        )
+
+    bundle = load_bundle(model_path)
+    print(f"✅ Model yüklendi ({bundle.kernel}, sürüm {bundle.version}).")
+    prediction_cache.clear()
+    _model_watcher = asyncio.create_task(_watch_active_model())
+
+def _load_active(active):
+    # Kayıt defterindeki modeller özetle (ve süreç içi önbellekten) yüklenir;
+    # özet taşımayan eski işaretçiler için doğrudan dosya yolu kullanılır
+    if active.get('hash'):
+        return registry.load_model(active['hash'])
+    return load_bundle(active['path'])
+
+def _install_bundle(new_bundle):
+    # Yeni paketi tek atama ile yayınla ve eski sürümün önbelleğini temizle
+    global bundle
+    bundle = new_bundle
+    prediction_cache.clear()
+
+async def _watch_active_model():
+    """
+    Etkin model işaretçisini düzenli aralıklarla kontrol eder. Herhangi bir
+    worker (ya da komut satırından eğitim) yeni bir model yayınladığında bu
+    worker da yeniden başlatılmadan yeni modele geçer.
+    """
+    global _active_model_mtime
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(Config.MODEL_CHECK_INTERVAL)
+        try:
+            active, mtime = registry.read_active_model()
+            if active is None or mtime == _active_model_mtime:
+                continue
+            _active_model_mtime = mtime
+            if bundle is not None and active['version'] == bundle.version:
+                continue
+            new_bundle = await loop.run_in_executor(inference_executor, _load_active, active)
+            _install_bundle(new_bundle)
+            print(f"🔄 Yeni model yüklendi ({new_bundle.kernel}, sürüm {new_bundle.version}).")
+        except Exception as e:
+            print(f"⚠️ Etkin model kontrol edilemedi: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    _model_watcher.cancel()
+    if micro_batcher is not None:
+        await micro_batcher.drain()
+    training_executor.shutdown(wait=False, cancel_futures=True)
+    inference_executor.shutdown(wait=False)
 
 @app.get("/")
 async def root():
@@ -70,31 +224,64 @@ async def root():
         "message": "İşe Alım Aday Değerlendirme API'ye Hoş Geldiniz",
         "endpoints": {
             "/predict": "Aday değerlendirmesi yapmak için",
-            "/train": "Modeli yeniden eğitmek için",
+            "/predict/batch": "Birden çok adayı tek istekte değerlendirmek için",
+            "/train": "Modeli arka planda yeniden eğitmek için (iş kimliği döner; ?mode=incremental ile artımlı)",
+            "/train/{job_id}": "Eğitim işinin durumu ve metrikleri için",
+            "/model": "Yüklü modelin sürümü ve sunum ayrıntıları için",
+            "/models": "Kayıt defterindeki model sürümleri ve etkin model için",
+            "/models/{model_hash}/activate": "Kayıtlı bir modeli yeniden eğitmeden etkinleştirmek için",
+            "/models/rollback": "Bir önceki etkin modele dönmek için",
+            "/cache/stats": "Tahmin önbelleği isabet/ıska/tahliye sayaçları için",
+            "/metrics": "Prometheus biçiminde süre histogramları ve sayaçlar için",
             "/docs": "API dokümantasyonu için"
         }
     }
 
+def _current_bundle():
+    # İstek boyunca tek bir paket kullanılır; eğitim sırasında değişse bile
+    # bu istek tutarlı bir (model, scaler) ikilisiyle tamamlanır
+    current = bundle
+    if current is None:
+        raise HTTPException(status_code=503, detail="Model henüz yüklenmedi.")
+    return current
+
 @app.post("/predict", response_model=CandidateResponse)
 async def predict(candidate: CandidateInput):
+    started = time.perf_counter()
+    # Girdi kontrolü
+    if not (0 <= candidate.tecrube_yili <= 10 and 0 <= candidate.teknik_puan <= 100):
+        raise HTTPException(
+            status_code=400,
+            detail="Geçersiz değer aralığı! Tecrübe yılı 0-10, teknik puan 0-100 arası olmalıdır."
+        )
+    current = _current_bundle()
+    validated = time.perf_counter()
+    PREDICT_STAGE_SECONDS.observe(validated - started, endpoint='predict', stage='validate')
+
     try:
-        # Girdi kontrolü
-        if not (0 <= candidate.tecrube_yili <= 10 and 0 <= candidate.teknik_puan <= 100):
-            raise HTTPException(
-                status_code=400,
-                detail="Geçersiz değer aralığı! Tecrübe yılı 0-10, teknik puan 0-100 arası olmalıdır."
-            )
-        
-        # Tahmin yap
-        prediction = predict_candidate(model, scaler, candidate.tecrube_yili, candidate.teknik_puan)
-        
-        # Güven skorunu hesapla
-        # X = np.array([[candidate.tecrube_yili, candidate.teknik_puan]])
-        X = pd.DataFrame([[candidate.tecrube_yili, candidate.teknik_puan]],
-                         columns=['tecrube_yili', 'teknik_puan'])
-        X_scaled = scaler.transform(X)
-        confidence = abs(model.decision_function(X_scaled)[0])
-        
+        cache_key = prediction_cache.key(current.version, candidate.tecrube_yili, candidate.teknik_puan)
+        cached = prediction_cache.get(cache_key) if prediction_cache.enabled else None
+        looked_up = time.perf_counter()
+        PREDICT_STAGE_SECONDS.observe(looked_up - validated, endpoint='predict', stage='cache_lookup')
+        if cached is not None:
+            prediction, confidence = cached
+            PREDICTIONS.inc(endpoint='predict', source='cache')
+        else:
+            # Tahmin ve güven skoru tek geçişte; mikro toplu işlem açıksa diğer
+            # eşzamanlı isteklerle birlikte tek vektörel çağrıda
+            if micro_batcher is not None:
+                prediction, confidence = await micro_batcher.submit(
+                    current, candidate.tecrube_yili, candidate.teknik_puan
+                )
+            else:
+                loop = asyncio.get_running_loop()
+                prediction, confidence = await loop.run_in_executor(
+                    inference_executor, current.score_candidate, candidate.tecrube_yili, candidate.teknik_puan
+                )
+            prediction_cache.put(cache_key, (prediction, confidence))
+            PREDICT_STAGE_SECONDS.observe(time.perf_counter() - looked_up, endpoint='predict', stage='inference')
+            PREDICTIONS.inc(endpoint='predict', source=current.serving_path)
+
         return {
             "prediction": int(prediction),
             "result": "İşe alınmaz" if prediction == 1 else "İşe alınır",
@@ -103,48 +290,192 @@ async def predict(candidate: CandidateInput):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/train", response_model=TrainingResponse)
-async def train_model():
-    try:
-        global model, scaler
-
-        from src.models.train_model import (
-            load_and_preprocess_data,
-            train_svm_models,
-            evaluate_and_save_models,
-            save_best_model_as_pickle
+@app.post("/predict/batch", response_model=BatchPredictionResponse)
+async def predict_batch(batch: CandidateBatchInput):
+    started = time.perf_counter()
+    # Girdiyi sütun dizilerine çevir
+    if batch.candidates is not None:
+        tecrube = np.array([c.tecrube_yili for c in batch.candidates], dtype=float)
+        teknik = np.array([c.teknik_puan for c in batch.candidates], dtype=float)
+    elif batch.tecrube_yili is not None and batch.teknik_puan is not None:
+        if len(batch.tecrube_yili) != len(batch.teknik_puan):
+            raise HTTPException(
+                status_code=400,
+                detail="tecrube_yili ve teknik_puan listeleri aynı uzunlukta olmalıdır."
+            )
+        tecrube = np.asarray(batch.tecrube_yili, dtype=float)
+        teknik = np.asarray(batch.teknik_puan, dtype=float)
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="'candidates' ya da 'tecrube_yili' ve 'teknik_puan' listeleri gönderilmelidir."
         )
+    current = _current_bundle()
 
-        # Veri oluştur ve kaydet
-        data = generate_candidate_data()
-        save_data(data)
-
-        # Veriyi yükle ve ölçekle
-        X_train, X_test, y_train, y_test, scaler = load_and_preprocess_data()
-
-        # Tüm modelleri eğit
-        models = train_svm_models(X_train, y_train)
-
-        # Değerlendirme ve kayıt
-        output_dir = 'src/results'
-        evaluate_and_save_models(models, X_test, y_test, output_dir)
+    try:
+        # Satır bazlı aralık kontrolü; geçersiz satırlar tüm isteği düşürmez
+        valid = (tecrube >= 0) & (tecrube <= 10) & (teknik >= 0) & (teknik <= 100)
+        validated = time.perf_counter()
+        PREDICT_STAGE_SECONDS.observe(validated - started, endpoint='batch', stage='validate')
 
-        model_dir = Config.PROJECT_ROOT / 'data'  # 🔧 Model yolu config'ten
-        save_best_model_as_pickle(models, X_test, y_test, scaler, model_dir)
+        predictions = np.empty(0, dtype=int)
+        confidences = np.empty(0, dtype=float)
+        if valid.any():
+            X = np.column_stack([tecrube[valid], teknik[valid]])
+            loop = asyncio.get_running_loop()
+            predictions, confidences = await loop.run_in_executor(
+                inference_executor, current.predict_candidates, X
+            )
+            PREDICT_STAGE_SECONDS.observe(time.perf_counter() - validated, endpoint='batch', stage='inference')
+            PREDICTIONS.inc(len(X), endpoint='batch', source=current.serving_path)
 
-        # En iyi modeli yükle
-        model_path = model_dir / 'best_model_linear.joblib'  # 🔧 Model dosyası
-        model, scaler = joblib.load(model_path)  # dosya adını dinamikleştirebilirsin
-        y_pred = model.predict(X_test)
-        accuracy = accuracy_score(y_test, y_pred)
+        results = []
+        scored = iter(zip(predictions.tolist(), confidences.tolist()))
+        for i, is_valid in enumerate(valid.tolist()):
+            if not is_valid:
+                results.append({
+                    "index": i,
+                    "error": "Geçersiz değer aralığı! Tecrübe yılı 0-10, teknik puan 0-100 arası olmalıdır."
+                })
+                continue
+            prediction, confidence = next(scored)
+            results.append({
+                "index": i,
+                "prediction": int(prediction),
+                "result": "İşe alınmaz" if prediction == 1 else "İşe alınır",
+                "confidence": float(confidence)
+            })
 
+        n_valid = int(valid.sum())
         return {
-            "message": "Model başarıyla yeniden eğitildi",
-            "accuracy": accuracy
+            "results": results,
+            "n_valid": n_valid,
+            "n_invalid": len(results) - n_valid
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/model")
+async def model_info():
+    return _current_bundle().info()
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return prediction_cache.stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    if not Config.METRICS:
+        raise HTTPException(status_code=404, detail="Metrikler kapalı (METRICS=0).")
+    for name, value in prediction_cache.stats().items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            PREDICTION_CACHE.set(value, counter=name)
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+def _run_training_pipeline(mode='full'):
+    # Eğitim modülleri (pandas, sklearn, Faker, matplotlib) yalnızca eğitim sürecinde yüklenir
+    from src.models.train_model import run_training_pipeline, run_incremental_pipeline
+    pipeline = run_incremental_pipeline if mode == 'incremental' else run_training_pipeline
+    # Eğitim süreci yeniden kullanılır; API'ye yalnızca bu işin gözlemleri taşınır
+    metrics.reset()
+
+    # Birden çok worker aynı anda eğitim başlatırsa dosya kilidiyle sıraya girer
+    try:
+        import fcntl
+    except ImportError:
+        return pipeline(), metrics.snapshot()
+    with open(Config.PROJECT_ROOT / 'data/.train.lock', 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return pipeline(), metrics.snapshot()
+
+async def _run_training_job(job, mode='full'):
+    global training_executor
+    async with training_lock:
+        job.status, job.stage = 'running', 'training'
+        job.started_at = time.time()
+        jobs.save(job)
+        loop = asyncio.get_running_loop()
+        try:
+            # Veri üretimi, eğitim, değerlendirme ve kayıt ayrı süreçte
+            result, observations = await loop.run_in_executor(training_executor, _run_training_pipeline, mode)
+            metrics.merge(observations)
+
+            # Yeni paketi hazırla ve tek atama ile yayınla
+            job.stage = 'loading'
+            jobs.save(job)
+            new_bundle = await loop.run_in_executor(inference_executor, registry.load_model, result['model_hash'])
+            _install_bundle(new_bundle)
+
+            job.metrics = result
+            job.model_version = new_bundle.version
+            job.status, job.stage = 'completed', 'done'
+        except BrokenProcessPool as e:
+            # Eğitim süreci öldü (OOM, sinyal...); bozuk havuz sonraki işler için yenisiyle değiştirilir
+            training_executor.shutdown(wait=False, cancel_futures=True)
+            training_executor = _new_training_executor()
+            job.status, job.error = 'failed', f"Eğitim süreci beklenmedik şekilde sonlandı: {e}"
+        except Exception as e:
+            job.status, job.error = 'failed', str(e)
+        finally:
+            job.finished_at = time.time()
+            jobs.save(job)
+            TRAINING_JOBS.inc(mode=mode, status=job.status)
+
+@app.post("/train", response_model=TrainingJobResponse, status_code=202)
+async def train_model(mode: str = 'full'):
+    # mode='incremental': yalnızca yeni kayıtlar eklenir ve etkin model bunlarla güncellenir
+    if mode not in ('full', 'incremental'):
+        raise HTTPException(status_code=400, detail="mode 'full' ya da 'incremental' olmalıdır.")
+    job = jobs.create()
+    task = asyncio.create_task(_run_training_job(job, mode))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return job.to_dict()
+
+@app.get("/train/{job_id}", response_model=TrainingJobResponse)
+async def training_status(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Eğitim işi bulunamadı.")
+    return job.to_dict()
+
+@app.get("/models")
+async def list_models():
+    active, _ = registry.read_active_model()
+    models = sorted(registry.read_manifest()['models'].values(),
+                    key=lambda entry: entry['created_at'], reverse=True)
+    return {"active": active.get('hash') if active else None, "models": models}
+
+async def _switch_model(model_hash, publish):
+    # İşaretçi yazılmadan önce model yüklenir; bozuk bir artefakt diğer
+    # worker'lara yayınlanmaz. Eğitimle aynı kilit kullanılır.
+    loop = asyncio.get_running_loop()
+    async with training_lock:
+        try:
+            new_bundle = await loop.run_in_executor(inference_executor, registry.load_model, model_hash)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Model yüklenemedi: {e}")
+        publish()
+        _install_bundle(new_bundle)
+    return new_bundle.info()
+
+@app.post("/models/{model_hash}/activate")
+async def activate_model(model_hash: str):
+    try:
+        model_hash = registry.resolve(model_hash)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Model kayıt defterinde bulunamadı.")
+    return await _switch_model(model_hash, lambda: registry.activate(model_hash))
+
+@app.post("/models/rollback")
+async def rollback_model():
+    try:
+        model_hash = registry.previous_model()
+    except LookupError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return await _switch_model(model_hash, registry.rollback)
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Birden çok worker için uygulama içe aktarma yolu olarak verilmelidir
+    uvicorn.run("src.api.app:app", host="0.0.0.0", port=8000, workers=Config.WEB_CONCURRENCY) 
\ No newline at end of file
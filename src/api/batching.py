@@ -0,0 +1,81 @@
+import asyncio
+import numpy as np
+from src import metrics
+
+BATCH_SIZE = metrics.histogram(
+    'micro_batch_size', 'Mikro toplu işlemde tek çağrıda değerlendirilen aday sayısı',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512))
+
+
+class MicroBatcher:
+    """
+    Eşzamanlı tekil tahminleri kısa bir süre biriktirip tek vektörel çağrıyla değerlendirir.
+
+    İlk istek geldiğinde max_wait saniyelik bir zamanlayıcı kurulur; zamanlayıcı
+    dolduğunda ya da kuyruk max_batch_size adaya ulaştığında birikenler
+    bundle.predict_candidates ile tek seferde skorlanır ve sonuçlar bekleyen
+    isteklere dağıtılır. Her istek kendi ModelBundle'ını getirir; model
+    değişimi sırasında kuyruktaki adaylar paket bazında gruplanır, böylece
+    hiçbir istek eski ve yeni modelin karışımını görmez.
+
+    Yalnızca olay döngüsü içinden kullanılır (kilit gerekmez).
+    """
+
+    def __init__(self, max_batch_size, max_wait, executor=None):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.executor = executor
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+
+    async def submit(self, bundle, tecrube_yili, teknik_puan):
+        """
+        Adayı kuyruğa ekler ve skorlanınca (tahmin, güven skoru) döndürür.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((bundle, tecrube_yili, teknik_puan, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        groups = {}
+        for item in pending:
+            groups.setdefault(id(item[0]), []).append(item)
+        for items in groups.values():
+            task = asyncio.get_running_loop().create_task(self._score(items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _score(self, items):
+        bundle = items[0][0]
+        X = np.array([(t, p) for _, t, p, _ in items], dtype=np.float64)
+        BATCH_SIZE.observe(len(items))
+        try:
+            loop = asyncio.get_running_loop()
+            predictions, confidences = await loop.run_in_executor(self.executor, bundle.predict_candidates, X)
+        except Exception as e:
+            for *_, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (*_, future), prediction, confidence in zip(items, predictions.tolist(), confidences.tolist()):
+            # İstemci bağlantıyı kapattıysa gelecek iptal edilmiş olabilir
+            if not future.done():
+                future.set_result((prediction, confidence))
+
+    async def drain(self):
+        """Bekleyen adayları hemen skorlar ve bitmelerini bekler (kapanış sırasında)."""
+        self._flush()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,76 @@
+import time
+import threading
+from collections import OrderedDict
+
+
+class PredictionCache:
+    """
+    /predict sonuçları için boyutu sınırlı LRU önbellek (isteğe bağlı TTL).
+
+    Anahtar, model sürümü ve belirli bir hassasiyete yuvarlanmış girdilerdir;
+    yeni bir model yüklendiğinde eski sürümün kayıtları hiçbir zaman eşleşmez
+    ve önbellek ayrıca tamamen temizlenir.
+    """
+
+    def __init__(self, max_size=10_000, ttl=0.0, decimals=6):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.decimals = decimals
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    @property
+    def enabled(self):
+        return self.max_size > 0
+
+    def key(self, version, tecrube_yili, teknik_puan):
+        return version, round(tecrube_yili, self.decimals), round(teknik_puan, self.decimals)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
@@ -0,0 +1,94 @@
+import os
+import json
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass
+class TrainingJob:
+    """Arka planda çalışan bir /train işinin durumu."""
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    # queued -> running -> completed | failed
+    status: str = 'queued'
+    # Ayrıntılı aşama: queued, training, loading, done (hata olursa kaldığı aşama)
+    stage: str = 'queued'
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    metrics: Optional[dict] = None
+    model_version: Optional[str] = None
+    error: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data['id'] = data.pop('job_id')
+        data.pop('elapsed_seconds', None)
+        return cls(**data)
+
+    def to_dict(self):
+        data = asdict(self)
+        data['job_id'] = data.pop('id')
+        end = self.finished_at or time.time()
+        data['elapsed_seconds'] = end - self.started_at if self.started_at else 0.0
+        return data
+
+
+class JobRegistry:
+    """
+    Eğitim işlerini kimliğe göre saklar. Bellek sınırlı kalsın diye
+    yalnızca son `max_jobs` iş tutulur; önce bitmiş en eski işler atılır.
+
+    `store_dir` verilirse iş durumları JSON dosyası olarak da yazılır; böylece
+    birden çok API worker'ı çalışırken iş hangi worker'da başlatılmış olursa
+    olsun durumu her worker'dan sorgulanabilir.
+    """
+
+    def __init__(self, max_jobs=100, store_dir=None):
+        self.max_jobs = max_jobs
+        self.store_dir = Path(store_dir) if store_dir else None
+        self._jobs = OrderedDict()
+
+    def create(self):
+        job = TrainingJob()
+        self._jobs[job.id] = job
+        self._prune()
+        self.save(job)
+        return job
+
+    def save(self, job):
+        if self.store_dir is None:
+            return
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        path = self.store_dir / f'{job.id}.json'
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(job.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    def get(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is not None or self.store_dir is None:
+            return job
+        # Başka bir worker'da başlatılmış iş
+        try:
+            with open(self.store_dir / f'{Path(job_id).name}.json') as f:
+                return TrainingJob.from_dict(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _prune(self):
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_jobs:
+                break
+            if self._jobs[job_id].status in ('completed', 'failed'):
+                del self._jobs[job_id]
+
+        if self.store_dir is not None and self.store_dir.exists():
+            files = sorted(self.store_dir.glob('*.json'), key=lambda p: p.stat().st_mtime)
+            for path in files[:max(0, len(files) - self.max_jobs)]:
+                path.unlink(missing_ok=True)
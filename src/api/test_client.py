@@ -1,3 +1,4 @@
+import time
 import requests
 import json
 
@@ -18,12 +19,17 @@ def test_predict():
     print(json.dumps(response.json(), indent=2, ensure_ascii=False))
 
 def test_train():
-    # Modeli yeniden eğit
-    response = requests.post(f"{BASE_URL}/train")
-    
+    # Eğitim işini başlat ve bitene kadar durumunu sorgula
+    job = requests.post(f"{BASE_URL}/train").json()
+    print(f"\nEğitim işi başlatıldı: {job['job_id']}")
+    while job["status"] in ("queued", "running"):
+        time.sleep(1)
+        job = requests.get(f"{BASE_URL}/train/{job['job_id']}").json()
+        print(f"  durum: {job['status']} ({job['stage']}, {job['elapsed_seconds']:.1f}s)")
+
     # Sonucu yazdır
     print("\nEğitim Sonucu:")
-    print(json.dumps(response.json(), indent=2, ensure_ascii=False))
+    print(json.dumps(job, indent=2, ensure_ascii=False))
 
 if __name__ == "__main__":
     print("API Test İstemcisi")
@@ -0,0 +1,74 @@
+"""
+Benchmark betiklerinin ortak yardımcıları.
+"""
+import os
+import shutil
+import tempfile
+import numpy as np
+from pathlib import Path
+from src.config import Config
+
+
+def use_isolated_project_root():
+    """
+    data/ ve src/results/ klasörlerini geçici bir dizine kopyalayıp
+    PROJECT_ROOT'u oraya yönlendirir; böylece eğitim yapan benchmark'lar
+    depodaki veri ve model dosyalarının üzerine yazmaz.
+
+    Ortam değişkeni de güncellendiği için alt süreçler aynı dizini görür.
+
+    Returns:
+        Path: Geçici proje kök dizini
+    """
+    source = Config.PROJECT_ROOT
+    root = Path(tempfile.mkdtemp(prefix="svm-bench-"))
+    shutil.copytree(source / 'data', root / 'data')
+    shutil.copytree(source / 'src/results', root / 'src/results')
+    os.environ["PROJECT_ROOT"] = str(root)
+    Config.PROJECT_ROOT = root
+    return root
+
+
+def peak_rss_mb():
+    """
+    Sürecin tepe bellek kullanımı (MB).
+
+    Linux'ta /proc/self/status içindeki VmHWM kullanılır; ru_maxrss exec
+    sonrasında üst süreçten devralındığı için alt süreç ölçümlerini bozar.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def latency_summary(samples):
+    """
+    Saniye cinsinden gecikme örneklerini milisaniye özetine çevirir.
+
+    Returns:
+        dict: n, ort, p50, p95, p99 ve maks değerleri (ms)
+    """
+    ms = np.asarray(samples, dtype=float) * 1000
+    if ms.size == 0:
+        return {'n': 0}
+    return {
+        'n': int(ms.size),
+        'mean_ms': float(ms.mean()),
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p95_ms': float(np.percentile(ms, 95)),
+        'p99_ms': float(np.percentile(ms, 99)),
+        'max_ms': float(ms.max()),
+    }
+
+
+def format_summary(name, summary):
+    if summary.get('n', 0) == 0:
+        return f"{name:>14}: örnek yok"
+    return (f"{name:>14}: n={summary['n']:<6} p50={summary['p50_ms']:7.2f}ms "
+            f"p95={summary['p95_ms']:7.2f}ms p99={summary['p99_ms']:7.2f}ms")
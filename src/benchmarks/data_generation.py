@@ -0,0 +1,35 @@
+"""
+Faker döngüsü ile vektörel veri üretiminin hızını karşılaştırır.
+
+Kullanım:
+    python -m src.benchmarks.data_generation --sizes 10000 1000000 --n-jobs -1
+"""
+import argparse
+import time
+from src.data.generate_data import generate_candidate_data, generate_candidate_data_fast
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 1_000_000])
+    parser.add_argument('--n-jobs', type=int, default=1)
+    parser.add_argument('--faker-limit', type=int, default=10_000,
+                        help='Faker döngüsünün ölçüleceği en büyük boyut')
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        start = time.perf_counter()
+        generate_candidate_data_fast(size, n_jobs=args.n_jobs)
+        fast = time.perf_counter() - start
+        line = f"{size:>10} satır: vektörel {fast:7.2f}s ({size / fast:12,.0f} satır/s)"
+
+        if size <= args.faker_limit:
+            start = time.perf_counter()
+            generate_candidate_data(size)
+            slow = time.perf_counter() - start
+            line += f" | faker {slow:7.2f}s ({slow / fast:6.1f}x)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Karar sınırı görsellerinin üretim süresini ölçer.
+
+Eski yol (her kernel için sırayla ızgara değerlendirme + çizim) ile
+render_decision_boundaries (tek ızgara, paralel çizim) karşılaştırılır;
+ardından aynı modellerle ikinci çağrının önbellekten dönme süresi yazdırılır.
+Görseller geçici bir klasöre yazılır.
+
+Kullanım:
+    python -m src.benchmarks.decision_plots --samples 2000 --resolution 100 400
+"""
+import argparse
+import tempfile
+import time
+import numpy as np
+from pathlib import Path
+
+
+def legacy_plot(model, X, y, kernel_name, output_dir, resolution):
+    # Önceki plot_decision_boundary gövdesi (ızgara çözünürlüğü parametreli)
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 6))
+    plt.scatter(X[:, 0], X[:, 1], c=y, cmap='coolwarm', alpha=0.6)
+    ax = plt.gca()
+    xlim = ax.get_xlim()
+    ylim = ax.get_ylim()
+    xx = np.linspace(xlim[0], xlim[1], resolution)
+    yy = np.linspace(ylim[0], ylim[1], resolution)
+    YY, XX = np.meshgrid(yy, xx)
+    xy = np.vstack([XX.ravel(), YY.ravel()]).T
+    Z = model.decision_function(xy).reshape(XX.shape)
+    ax.contour(XX, YY, Z, colors='k', levels=[-1, 0, 1], alpha=0.5, linestyles=['--', '-', '--'])
+    plt.title(f'SVM Karar Sınırı - {kernel_name}')
+    plt.savefig(Path(output_dir) / f'decision_boundary_{kernel_name}.png')
+    plt.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--samples', type=int, default=2000)
+    parser.add_argument('--resolution', type=int, nargs='+', default=[100, 400])
+    parser.add_argument('--n-jobs', type=int, default=-1)
+    args = parser.parse_args()
+
+    from sklearn.preprocessing import StandardScaler
+    from src.data.generate_data import generate_candidate_data_fast
+    from src.models.train_model import train_svm_models
+    from src.models.decision_plots import render_decision_boundaries
+
+    data = generate_candidate_data_fast(args.samples)
+    X = StandardScaler().fit_transform(data[['tecrube_yili', 'teknik_puan']].to_numpy(dtype=np.float64))
+    y = data['etiket'].to_numpy()
+    models = train_svm_models(X, y)
+
+    print(f"{'çözünürlük':>10} {'eski (s)':>9} {'yeni (s)':>9} {'önbellek (s)':>13}")
+    for resolution in args.resolution:
+        with tempfile.TemporaryDirectory() as output_dir:
+            start = time.perf_counter()
+            for name, model in models.items():
+                legacy_plot(model, X, y, name, output_dir, resolution)
+            legacy_seconds = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            start = time.perf_counter()
+            render_decision_boundaries(models, X, y, output_dir, resolution=resolution, n_jobs=args.n_jobs)
+            new_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            status = render_decision_boundaries(models, X, y, output_dir, resolution=resolution, n_jobs=args.n_jobs)
+            cached_seconds = time.perf_counter() - start
+            assert set(status.values()) == {'cached'}
+
+        print(f"{resolution:>10} {legacy_seconds:>9.2f} {new_seconds:>9.2f} {cached_seconds:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Tekrar sıkıştırmalı SVC eğitiminin süre ve bellek kazancını ölçer.
+
+Her boyut ve kernel için eğitim iki yolla ayrı süreçlerde yapılır: tüm
+satırlarla (önceki yol) ve tekrarlar sample_weight'e indirilerek. Süre,
+tepe RSS ve sabit bir ızgarada iki modelin etiket uyumu yazdırılır. Tüm
+satırlarla eğitim --full-max satırın üzerinde atlanır (1M satırda SVC
+saatler sürer).
+
+Kullanım:
+    python -m src.benchmarks.deduplicate --sizes 100000 1000000 --kernels linear rbf
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import numpy as np
+from src.benchmarks.common import peak_rss_mb
+
+
+def measure(size, kernel, deduplicate):
+    from sklearn.preprocessing import StandardScaler
+    from src.data.generate_data import generate_candidate_data_fast
+    from src.models.train_model import train_svm_models, compress_duplicates
+
+    data = generate_candidate_data_fast(size)
+    X_raw = data[['tecrube_yili', 'teknik_puan']].to_numpy(dtype=np.float64)
+    y = data['etiket'].to_numpy()
+    del data
+    scaler = StandardScaler().fit(X_raw)
+    X = scaler.transform(X_raw)
+
+    start = time.perf_counter()
+    model = train_svm_models(X, y, [kernel], deduplicate=deduplicate)[kernel]
+    seconds = time.perf_counter() - start
+
+    tecrube, teknik = np.meshgrid(np.linspace(0, 10, 41), np.linspace(0, 100, 51))
+    grid = scaler.transform(np.column_stack([tecrube.ravel(), teknik.ravel()]))
+    print(json.dumps({
+        'seconds': seconds,
+        'max_rss_mb': peak_rss_mb(),
+        'unique_rows': len(compress_duplicates(X, y)[0]) if deduplicate else size,
+        'n_support': int(len(model.support_)),
+        'labels': (model.decision_function(grid) > 0).astype(int).tolist(),
+    }))
+
+
+def run(size, kernel, deduplicate):
+    output = subprocess.run(
+        [sys.executable, '-m', 'src.benchmarks.deduplicate', '--measure', str(size), kernel, str(int(deduplicate))],
+        capture_output=True, text=True, check=True, env=os.environ
+    ).stdout.strip().splitlines()[-1]
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--kernels', nargs='+', default=['linear', 'rbf'])
+    parser.add_argument('--full-max', type=int, default=200_000,
+                        help='Tüm satırlarla eğitimin ölçüleceği en büyük boyut')
+    parser.add_argument('--measure', nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        size, kernel, deduplicate = args.measure
+        measure(int(size), kernel, deduplicate == '1')
+        return
+
+    for size in args.sizes:
+        print(f"\n{size:,} satır")
+        for kernel in args.kernels:
+            compressed = run(size, kernel, True)
+            line = (f"  {kernel:>8}: sıkıştırılmış {compressed['seconds']:8.3f}s "
+                    f"RSS {compressed['max_rss_mb']:7.1f}MB ({compressed['unique_rows']} tekil satır)")
+            if size <= args.full_max:
+                full = run(size, kernel, False)
+                agreement = np.mean(np.array(full['labels']) == np.array(compressed['labels']))
+                line += (f" | tüm satırlar {full['seconds']:8.2f}s RSS {full['max_rss_mb']:7.1f}MB"
+                         f" | hızlanma {full['seconds'] / compressed['seconds']:.0f}x, etiket uyumu {agreement:.4f}")
+            else:
+                line += " | tüm satırlar atlandı (--full-max)"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
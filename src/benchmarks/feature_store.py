@@ -0,0 +1,72 @@
+"""
+CSV, Parquet ve .npy özellik deposunun yükleme süresi ve bellek kullanımını karşılaştırır.
+
+Her boyut için veri geçici bir proje dizininde parça parça üretilir; her
+yükleme yöntemi ayrı bir süreçte çalıştırılıp süre ve tepe RSS ölçülür.
+Yükleme sonrası özellik sütunları toplanarak verinin gerçekten okunması sağlanır.
+
+Kullanım:
+    python -m src.benchmarks.feature_store --sizes 10000 1000000 10000000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from src.benchmarks.common import use_isolated_project_root, peak_rss_mb
+
+COLUMNS = ['tecrube_yili', 'teknik_puan', 'etiket']
+
+
+def measure(method):
+    from src.data.feature_store import read_columns
+    import pandas as pd
+
+    start = time.perf_counter()
+    if method == 'csv_full':
+        # Önceki yol: tüm metin sütunlarıyla birlikte read_csv
+        df = pd.read_csv(os.environ['BENCH_ROOT'] + '/data/bench.csv')
+        total = float(df['tecrube_yili'].sum() + df['teknik_puan'].sum())
+    else:
+        # Eğitim yolu ve Streamlit ile aynı giriş noktası: read_columns
+        filename = {'csv_usecols': 'bench.csv', 'parquet': 'bench.parquet', 'npy_memmap': 'bench_features'}[method]
+        df = read_columns(filename, COLUMNS)
+        total = float(df['tecrube_yili'].sum() + df['teknik_puan'].sum())
+    seconds = time.perf_counter() - start
+
+    print(json.dumps({'method': method, 'seconds': seconds, 'max_rss_mb': peak_rss_mb(), 'checksum': total}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure)
+        return
+
+    root = use_isolated_project_root()
+    os.environ['BENCH_ROOT'] = str(root)
+    from src.data.generate_data import save_data_streaming
+    from src.data.feature_store import build_feature_store
+
+    for size in args.sizes:
+        save_data_streaming(size, 'bench.csv')
+        save_data_streaming(size, 'bench.parquet')
+        build_feature_store('bench.parquet', 'bench_features')
+
+        print(f"\n{size:,} satır")
+        for method in ['csv_full', 'csv_usecols', 'parquet', 'npy_memmap']:
+            output = subprocess.run(
+                [sys.executable, '-m', 'src.benchmarks.feature_store', '--measure', method],
+                capture_output=True, text=True, check=True, env=os.environ
+            ).stdout.strip().splitlines()[-1]
+            result = json.loads(output)
+            print(f"  {method:>12}: {result['seconds']:7.3f}s  tepe RSS {result['max_rss_mb']:8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
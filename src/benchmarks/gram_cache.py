@@ -0,0 +1,68 @@
+"""
+Gram matrisi önbellekli hiperparametre aramasını fit başına kernel hesaplayan aramayla karşılaştırır.
+
+Aynı ızgara ve katlar erken eleme olmadan tek çekirdekte taranır: mevcut yol
+(her fit kernel'i baştan hesaplar) tekrar sıkıştırmasız ve sıkıştırmalı
+olarak, ve Gram önbelleği (tekrarları her zaman sıkıştırır; sigmoid fit
+başına yolda kalır). Her yol için süre, seçilen parametreler ve
+test doğruluğu; önbellekli modeller için de olağan SVC'ye çevrilmiş modelin
+karar değerleri ile ikili katsayıların önbellekteki çözülmüş kernel
+parametreleriyle doğrudan uygulanmasından elde edilen karar değerleri
+arasındaki en büyük fark yazdırılır.
+
+Kullanım:
+    python -m src.benchmarks.gram_cache --samples 2000 5000 --cv 5
+"""
+import argparse
+import time
+import numpy as np
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--samples', type=int, nargs='+', default=[2000, 5000])
+    parser.add_argument('--cv', type=int, default=5)
+    parser.add_argument('--kernels', nargs='+', default=['linear', 'rbf', 'poly', 'sigmoid'])
+    args = parser.parse_args()
+
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+    from src.data.generate_data import generate_candidate_data_fast
+    from src.models.gram import GramCache, kernel_matrix
+    from src.models.train_model import search_svm_models
+
+    for samples in args.samples:
+        data = generate_candidate_data_fast(samples)
+        X = data[['tecrube_yili', 'teknik_puan']].to_numpy(dtype=np.float64)
+        y = data['etiket'].to_numpy()
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        scaler = StandardScaler().fit(X_train)
+        X_train, X_test = scaler.transform(X_train), scaler.transform(X_test)
+
+        print(f"\n{samples:,} aday ({len(np.unique(X_train, axis=0))} tekil özellik satırı)")
+        baseline = None
+        for label, gram_cache, deduplicate in [('fit başına kernel', False, False),
+                                               ('fit başına kernel + sıkıştırma', False, True),
+                                               ('Gram önbelleği', True, False)]:
+            start = time.perf_counter()
+            models, results = search_svm_models(X_train, y_train, kernels=args.kernels, cv=args.cv, n_jobs=1,
+                                                cutoff=float('inf'), gram_cache=gram_cache, deduplicate=deduplicate)
+            seconds = time.perf_counter() - start
+            baseline = baseline or seconds
+            print(f"  {label:<31} {seconds:7.2f}s  ({len(results)} konfigürasyon x {args.cv} kat, "
+                  f"{baseline / seconds:.1f}x)")
+            for kernel, model in models.items():
+                line = (f"    {kernel:>8}: C={model.C:<4} test={model.score(X_test, y_test):.4f}")
+                if gram_cache:
+                    # Olağan SVC'ye çevrilmiş model, önbellekteki kernel parametreleriyle aynı kararı vermeli
+                    params = {k: v for k, v in model.get_params().items() if k in ('gamma', 'degree', 'coef0')}
+                    resolved = GramCache(X_train).kernel_params(kernel, params)
+                    K_test = kernel_matrix(X_test, model.support_vectors_, kernel, **resolved)
+                    decision = K_test @ model.dual_coef_[0] + model.intercept_[0]
+                    diff = np.abs(decision - model.decision_function(X_test)).max()
+                    line += f"  |Δkarar| {diff:.1e}"
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Artımlı yeniden eğitimin tam yeniden eğitime göre süresini ve doğruluğunu ölçer.
+
+Her geçmiş boyutu için önce geçmiş veriyle bir model eğitilir. Ardından
+aynı yeni kayıtlar iki yolla modele katılır:
+tam yeniden eğitim (scaler + model tüm veriyle baştan) ve incremental_update
+(scaler partial_fit + önceki destek vektörleri/katsayılar). İki model aynı
+test kümesinde karşılaştırılır.
+
+Kullanım:
+    python -m src.benchmarks.incremental_retrain --history 1000 10000 50000 --new 200 --kernel linear
+"""
+import argparse
+import time
+import numpy as np
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--history', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--new', type=int, default=200)
+    parser.add_argument('--kernel', default='linear', help="SVC kernel'i ya da 'sgd'")
+    args = parser.parse_args()
+
+    from sklearn.svm import SVC
+    from sklearn.linear_model import SGDClassifier
+    from sklearn.preprocessing import StandardScaler
+    from src.data.generate_data import generate_candidate_data_fast
+    from src.data.feature_store import FEATURE_COLUMNS, LABEL_COLUMN
+    from src.models.train_model import incremental_update, _is_test_row
+
+    def make_model():
+        if args.kernel == 'sgd':
+            return SGDClassifier(loss='hinge', random_state=42)
+        return SVC(kernel=args.kernel)
+
+    def split(data):
+        X = data[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+        y = data[LABEL_COLUMN].to_numpy()
+        is_test = _is_test_row(np.arange(len(data)), 5)
+        return X[~is_test], y[~is_test], X[is_test], y[is_test]
+
+    def fit(X, y):
+        scaler = StandardScaler().fit(X)
+        return make_model().fit(scaler.transform(X), y), scaler
+
+    print(f"{'geçmiş':>8} {'tam (s)':>9} {'artımlı (s)':>12} {'hızlanma':>9} {'tam acc':>8} {'artımlı acc':>12}")
+    for n_history in args.history:
+        X_old, y_old, X_old_test, y_old_test = split(generate_candidate_data_fast(n_history, seed=42))
+        X_new, y_new, X_new_test, y_new_test = split(generate_candidate_data_fast(args.new, seed=7))
+        X_test = np.vstack([X_old_test, X_new_test])
+        y_test = np.concatenate([y_old_test, y_new_test])
+        previous, previous_scaler = fit(X_old, y_old)
+
+        start = time.perf_counter()
+        full, full_scaler = fit(np.vstack([X_old, X_new]), np.concatenate([y_old, y_new]))
+        full_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        incremental, incremental_scaler = incremental_update(previous, previous_scaler, X_new, y_new)
+        incremental_seconds = time.perf_counter() - start
+
+        full_acc = full.score(full_scaler.transform(X_test), y_test)
+        incremental_acc = incremental.score(incremental_scaler.transform(X_test), y_test)
+        print(f"{n_history:>8} {full_seconds:>9.3f} {incremental_seconds:>12.3f} "
+              f"{full_seconds / incremental_seconds:>8.1f}x {full_acc:>8.4f} {incremental_acc:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+/predict mikro toplu işlemin tekil yola göre verim ve gecikmesini ölçer.
+
+Uygulama süreç içinde (ASGI transport, ağ yok) her ayar için yeniden
+başlatılır ve aynı eşzamanlılıkla, hiç tekrarlanmayan adaylarla (önbellek
+isabeti olmadan) /predict gönderilir. Mikro toplu işlemin kazancı sklearn
+modeli yolunda belirgindir; ölçüm için geçici proje kopyasında --kernel ile
+bir model eğitilir (varsayılan RBF).
+
+Kullanım:
+    python -m src.benchmarks.micro_batching --concurrency 64 --requests 3000 --configs 16:1 64:2 256:5
+"""
+import argparse
+import asyncio
+import itertools
+from src.config import Config
+from src.benchmarks.common import use_isolated_project_root, format_summary
+from src.benchmarks.suite import drive, random_candidates, scenario_result
+
+
+async def measure(app, candidates, sent, concurrency, requests):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            async def predict(i):
+                t, p = candidates[next(sent) % len(candidates)]
+                response = await client.post('/predict', json={'tecrube_yili': t, 'teknik_puan': p})
+                response.raise_for_status()
+
+            await drive(predict, concurrency, total=concurrency)  # ısınma
+            return scenario_result(*await drive(predict, concurrency, total=requests))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=3000)
+    parser.add_argument('--configs', nargs='+', default=['16:1', '64:2', '256:5'],
+                        help='MAX_SIZE:MAX_WAIT_MS çiftleri')
+    parser.add_argument('--kernel', default='rbf')
+    parser.add_argument('--train-samples', type=int, default=2000)
+    args = parser.parse_args()
+
+    root = use_isolated_project_root()
+    import joblib
+    from src.data.generate_data import generate_candidate_data_fast, save_data
+    from src.models.train_model import load_and_preprocess_data, train_svm_models
+
+    save_data(generate_candidate_data_fast(args.train_samples))
+    X_train, _, y_train, _, scaler = load_and_preprocess_data()
+    model = train_svm_models(X_train, y_train, [args.kernel])[args.kernel]
+    Config.MODEL_PATH = str(root / f'data/bench_model_{args.kernel}.joblib')
+    joblib.dump((model, scaler), Config.MODEL_PATH)
+    from src.api.app import app
+
+    candidates = random_candidates(args.requests * (len(args.configs) + 2))
+    sent = itertools.count()
+
+    Config.MICRO_BATCH = False
+    baseline = asyncio.run(measure(app, candidates, sent, args.concurrency, args.requests))
+    print(f"{format_summary('tekil', baseline)} rps={baseline['rps']:8.1f}")
+    for config in args.configs:
+        max_size, max_wait_ms = config.split(':')
+        Config.MICRO_BATCH = True
+        Config.MICRO_BATCH_MAX_SIZE, Config.MICRO_BATCH_MAX_WAIT_MS = int(max_size), float(max_wait_ms)
+        result = asyncio.run(measure(app, candidates, sent, args.concurrency, args.requests))
+        print(f"{format_summary(config, result)} rps={result['rps']:8.1f} "
+              f"({result['rps'] / baseline['rps']:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
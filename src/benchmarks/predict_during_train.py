@@ -0,0 +1,85 @@
+"""
+/train çalışırken /predict gecikmesinin sabit kaldığını gösteren yük testi.
+
+Uygulama süreç içinde (ASGI transport, ağ yok) çalıştırılır. Önce boşta
+/predict gecikmesi ölçülür, ardından /train işi başlatılıp iş bitene kadar
+aynı eşzamanlılıkla /predict gönderilir ve p99 değerleri karşılaştırılır.
+Her istek farklı bir aday gönderir ve tahmin önbelleği kapatılır; böylece
+her /predict çıkarım havuzunda gerçekten skorlanır. Eğitim geçici bir proje
+kopyası üzerinde yapılır.
+
+Kullanım:
+    python -m src.benchmarks.predict_during_train --concurrency 16 --train-samples 5000
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import time
+from src.config import Config
+from src.benchmarks.common import use_isolated_project_root, latency_summary, format_summary
+from src.benchmarks.suite import random_candidates
+
+
+async def timed_predict(client, payload, latencies):
+    start = time.perf_counter()
+    response = await client.post('/predict', json=payload)
+    latencies.append(time.perf_counter() - start)
+    response.raise_for_status()
+
+
+async def predict_round(client, concurrency, latencies, candidates):
+    payloads = [{'tecrube_yili': t, 'teknik_puan': p} for t, p in itertools.islice(candidates, concurrency)]
+    await asyncio.gather(*(timed_predict(client, payload, latencies) for payload in payloads))
+
+
+async def run(args):
+    import httpx
+    from src.api.app import app
+
+    transport = httpx.ASGITransport(app=app)
+    candidates = itertools.cycle(random_candidates(100_000))
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            await predict_round(client, args.concurrency, [], candidates)  # ısınma
+
+            baseline = []
+            for _ in range(args.rounds):
+                await predict_round(client, args.concurrency, baseline, candidates)
+
+            during = []
+            train_start = time.perf_counter()
+            job = (await client.post('/train')).json()
+            while job['status'] in ('queued', 'running'):
+                await predict_round(client, args.concurrency, during, candidates)
+                job = (await client.get(f"/train/{job['job_id']}")).json()
+            train_seconds = time.perf_counter() - train_start
+            cache = (await client.get('/cache/stats')).json()
+
+    idle, busy = latency_summary(baseline), latency_summary(during)
+    print(format_summary('boşta', idle))
+    print(format_summary('eğitim sırası', busy))
+    print(f"/train: {job['status']} {job['metrics'] or job['error']} ({train_seconds:.1f}s)")
+    print(f"Tahmin önbelleği isabeti: {cache['hits']} (0 olmalı)")
+    if busy.get('n'):
+        print(f"p99 oranı (eğitim / boşta): {busy['p99_ms'] / idle['p99_ms']:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--rounds', type=int, default=50, help='Boşta ölçüm tur sayısı')
+    parser.add_argument('--train-samples', type=int, default=5000,
+                        help='Eğitimin ölçüm boyunca sürmesi için üretilecek aday sayısı')
+    args = parser.parse_args()
+
+    root = use_isolated_project_root()
+    os.environ['TRAIN_NUM_SAMPLES'] = str(args.train_samples)
+    # Önbellek isabetleri çıkarım havuzunu atlar; ölçüm yalnızca gerçek skorlamayı içermeli
+    Config.PREDICTION_CACHE_SIZE = 0
+    print(f"Geçici proje dizini: {root}")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+/predict yolunun istek başına gecikmesini ölçen mikro benchmark.
+
+Eski yol (predict_candidate + DataFrame + ikinci transform/decision_function),
+tek geçişli score_candidate ve (katsayı dosyası varsa) kapalı form doğrusal
+skorlayıcı karşılaştırılır.
+
+Kullanım:
+    python -m src.benchmarks.predict_latency --n 5000
+"""
+import argparse
+import time
+import warnings
+import joblib
+import numpy as np
+import pandas as pd
+from src.config import Config
+from src.models.train_model import predict_candidate, score_candidate
+from src.models.linear_scorer import LinearScorer, coefficient_path
+
+
+def legacy_predict(model, scaler, tecrube_yili, teknik_puan):
+    # Önceki /predict gövdesi: iki transform, iki SVM değerlendirmesi, bir DataFrame
+    prediction = predict_candidate(model, scaler, tecrube_yili, teknik_puan)
+    X = pd.DataFrame([[tecrube_yili, teknik_puan]], columns=['tecrube_yili', 'teknik_puan'])
+    X_scaled = scaler.transform(X)
+    confidence = abs(model.decision_function(X_scaled)[0])
+    return prediction, confidence
+
+
+def measure(fn, model, scaler, inputs):
+    timings = np.empty(len(inputs))
+    for i, (tecrube, teknik) in enumerate(inputs):
+        start = time.perf_counter()
+        fn(model, scaler, tecrube, teknik)
+        timings[i] = time.perf_counter() - start
+    return timings * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--n', type=int, default=2000, help='Ölçülecek istek sayısı')
+    parser.add_argument('--model', default=str(Config.PROJECT_ROOT / 'data/best_model_linear.joblib'))
+    args = parser.parse_args()
+
+    model, scaler = joblib.load(args.model)
+    rng = np.random.default_rng(42)
+    inputs = np.column_stack([rng.uniform(0, 10, args.n), rng.uniform(0, 100, args.n)]).tolist()
+
+    # Sonuçların aynı olduğunu doğrula
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for tecrube, teknik in inputs[:200]:
+            old = legacy_predict(model, scaler, tecrube, teknik)
+            new = score_candidate(model, scaler, tecrube, teknik)
+            assert old[0] == new[0] and np.isclose(old[1], new[1]), (tecrube, teknik)
+
+        paths = [('legacy', legacy_predict), ('fused', score_candidate)]
+        if coefficient_path(args.model).exists():
+            scorer = LinearScorer.load(coefficient_path(args.model))
+            paths.append(('closed', lambda model, scaler, t, p: scorer.score_candidate(t, p)))
+
+        for name, fn in paths:
+            measure(fn, model, scaler, inputs[:100])  # ısınma
+            t = measure(fn, model, scaler, inputs)
+            print(f"{name:>7}: p50={np.percentile(t, 50):8.1f}µs  "
+                  f"p99={np.percentile(t, 99):8.1f}µs  ort={t.mean():8.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
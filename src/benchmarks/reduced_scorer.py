@@ -0,0 +1,76 @@
+"""
+Doğrusal olmayan SVC'lerin sıkıştırılmış skorlayıcıyla sunumunu asıl modelle karşılaştırır.
+
+Her boyut ve kernel için model eğitilir, compress_model ile dayanak
+noktalarına indirilir. Destek vektörü / dayanak sayısı, test doğruluğu farkı,
+tek aday gecikmesi (API'nin /predict yolu) ve toplu tahminde satır başına
+süre yazdırılır. Varsayılan olarak tekrar sıkıştırması kapalıdır; destek
+vektörü sayısı veriyle büyür (en kötü durum).
+
+Kullanım:
+    python -m src.benchmarks.reduced_scorer --sizes 20000 100000 --kernels rbf poly sigmoid
+"""
+import argparse
+import time
+import numpy as np
+
+
+def per_call_us(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20_000, 100_000])
+    parser.add_argument('--kernels', nargs='+', default=['rbf', 'poly', 'sigmoid'])
+    parser.add_argument('--deduplicate', action='store_true', help='Eğitimde tekrar sıkıştırması kullan')
+    parser.add_argument('--batch', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+    from src.data.generate_data import generate_candidate_data_fast
+    from src.models.inference import score_candidate, predict_candidates
+    from src.models.reduced_scorer import compress_model
+    from src.models.train_model import train_svm_models
+
+    rng = np.random.default_rng(0)
+    batch = np.column_stack([rng.integers(0, 11, args.batch), rng.integers(0, 101, args.batch)]).astype(np.float64)
+
+    for size in args.sizes:
+        data = generate_candidate_data_fast(size)
+        X = data[['tecrube_yili', 'teknik_puan']].to_numpy(dtype=np.float64)
+        y = data['etiket'].to_numpy()
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        scaler = StandardScaler().fit(X_train)
+        print(f"\n{size:,} aday")
+
+        for kernel in args.kernels:
+            model = train_svm_models(scaler.transform(X_train), y_train, [kernel], deduplicate=args.deduplicate)[kernel]
+            start = time.perf_counter()
+            scorer = compress_model(model, scaler)
+            compress_seconds = time.perf_counter() - start
+            if scorer is None:
+                print(f"  {kernel:>8}: {len(model.support_)} destek vektörü, sıkıştırılamadı")
+                continue
+
+            accuracy = np.mean(predict_candidates(model, scaler, X_test)[0] == y_test)
+            reduced_accuracy = np.mean(scorer.predict_candidates(X_test)[0] == y_test)
+            single = per_call_us(lambda: score_candidate(model, scaler, 5.0, 80.0), args.repeat)
+            reduced_single = per_call_us(lambda: scorer.score_candidate(5.0, 80.0), args.repeat)
+            bulk = per_call_us(lambda: predict_candidates(model, scaler, batch), 5) / args.batch
+            reduced_bulk = per_call_us(lambda: scorer.predict_candidates(batch), 5) / args.batch
+            report = scorer.report
+            print(f"  {kernel:>8}: {report['support_vectors']} destek vektörü -> {report['landmarks']} dayanak "
+                  f"({compress_seconds:.2f}s), ızgara uyumu {report['agreement']:.4f}, "
+                  f"doğruluk {accuracy:.4f} -> {reduced_accuracy:.4f}")
+            print(f"            tek aday {single:7.1f}µs -> {reduced_single:6.1f}µs | "
+                  f"toplu {bulk:6.3f}µs/satır -> {reduced_bulk:6.3f}µs/satır")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+API'nin soğuk açılış süresini ölçer.
+
+Her ölçüm yeni bir Python sürecinde yapılır: modül import süresi, startup
+olayının süresi ve ilk başarılı /predict yanıtına kadar geçen toplam süre
+raporlanır. Hangi ağır kütüphanelerin yüklendiği de yazdırılır.
+
+Kullanım:
+    python -m src.benchmarks.startup --runs 5
+    MODEL_PATH=data/best_model_rbf.joblib python -m src.benchmarks.startup
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ['sklearn', 'pandas', 'matplotlib', 'faker', 'joblib']
+
+
+def measure():
+    start = time.perf_counter()
+    from src.api.app import app, predict, startup_event, shutdown_event, CandidateInput
+    imported = time.perf_counter()
+
+    import asyncio
+
+    async def first_predict():
+        await startup_event()
+        started = time.perf_counter()
+        await predict(CandidateInput(tecrube_yili=3.5, teknik_puan=75.0))
+        answered = time.perf_counter()
+        await shutdown_event()
+        return started, answered
+
+    started, answered = asyncio.run(first_predict())
+    print(json.dumps({
+        'import_seconds': imported - start,
+        'startup_seconds': started - imported,
+        'first_predict_seconds': answered - start,
+        'loaded': [m for m in HEAVY_MODULES if m in sys.modules]
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--measure', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure()
+        return
+
+    results = []
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, '-m', 'src.benchmarks.startup', '--measure'],
+            capture_output=True, text=True, check=True, env=os.environ
+        ).stdout.strip().splitlines()[-1]
+        results.append(json.loads(output))
+
+    for key in ['import_seconds', 'startup_seconds', 'first_predict_seconds']:
+        values = sorted(r[key] for r in results)
+        print(f"{key:>22}: medyan {values[len(values) // 2] * 1000:8.1f}ms  min {values[0] * 1000:8.1f}ms")
+    print(f"{'yüklenen kütüphaneler':>22}: {', '.join(results[-1]['loaded']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+API ve eğitim hattı için etkileşimsiz benchmark takımı.
+
+Uygulama süreç içinde (ASGI transport, ağ yok) çalıştırılır ve istenen
+eşzamanlılıkla şu senaryolar ölçülür:
+  - /predict
+  - /predict/batch (--batch-size aday)
+  - /train sürerken /predict
+Her senaryo için p50/p95/p99 gecikme ve saniyedeki istek sayısı raporlanır.
+Ardından her veri boyutu için load_and_preprocess_data, train_svm_models ve
+evaluate_and_save_models aşamalarının süreleri ölçülür.
+
+Sonuçlar --output ile JSON olarak yazılır. --baseline ile önceki bir JSON
+verilirse p99 gecikmeleri ve aşama süreleri karşılaştırılır; --tolerance
+oranından fazla kötüleşme varsa betik 1 koduyla çıkar. Tüm eğitimler
+geçici bir proje kopyası üzerinde yapılır.
+
+Kullanım:
+    python -m src.benchmarks.suite --concurrency 16 --sizes 1000 10000 --output bench.json
+    python -m src.benchmarks.suite --baseline bench.json --tolerance 0.25
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+from src.benchmarks.common import use_isolated_project_root, latency_summary, format_summary
+
+
+def random_candidates(n, seed=42):
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.uniform(0, 10, n), rng.uniform(0, 100, n)]).round(2).tolist()
+
+
+async def drive(send, concurrency, total=None, until=None):
+    """
+    `concurrency` eşzamanlı işçiyle send(i) çağırır; total isteğe ulaşınca ya
+    da until() doğru dönünce durur.
+
+    Returns:
+        tuple: (gecikmeler (s), duvar saati süresi (s))
+    """
+    latencies = []
+    counter = iter(range(total if total is not None else sys.maxsize))
+
+    async def worker():
+        for i in counter:
+            if until is not None and until():
+                return
+            start = time.perf_counter()
+            await send(i)
+            latencies.append(time.perf_counter() - start)
+            # Önbellek isabetinde ASGI yolu hiç askıya alınmayabilir; olay döngüsüne
+            # sıra verilmezse diğer işçiler ve eğitim tamamlama geri çağrıları çalışamaz
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start
+
+
+def scenario_result(latencies, wall_seconds, rows_per_request=1):
+    result = latency_summary(latencies)
+    result['rps'] = len(latencies) / wall_seconds if wall_seconds else 0.0
+    result['rows_per_second'] = result['rps'] * rows_per_request
+    return result
+
+
+async def run_api(args):
+    import httpx
+    from src.api.app import app
+
+    # Senaryolar boyunca aynı aday tekrar gönderilmez; ölçüm önbellek isabetlerine dayanmaz
+    candidates = random_candidates(max(args.requests * 50, args.batch_size))
+    sent = itertools.count()
+    batch = {'candidates': [{'tecrube_yili': t, 'teknik_puan': p} for t, p in candidates[:args.batch_size]]}
+    results = {}
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            async def predict(i):
+                t, p = candidates[next(sent) % len(candidates)]
+                response = await client.post('/predict', json={'tecrube_yili': t, 'teknik_puan': p})
+                response.raise_for_status()
+
+            async def predict_batch(i):
+                response = await client.post('/predict/batch', json=batch)
+                response.raise_for_status()
+
+            await drive(predict, args.concurrency, total=args.concurrency)  # ısınma
+            results['predict'] = scenario_result(*await drive(predict, args.concurrency, total=args.requests))
+            results['predict_batch'] = scenario_result(
+                *await drive(predict_batch, args.concurrency, total=args.batch_requests), args.batch_size)
+
+            if args.train_samples:
+                job = (await client.post('/train')).json()
+                state = {'done': False}
+
+                async def poll():
+                    while True:
+                        status = (await client.get(f"/train/{job['job_id']}")).json()
+                        if status['status'] not in ('queued', 'running'):
+                            state['done'] = True
+                            return status
+                        await asyncio.sleep(0.2)
+
+                train_start = time.perf_counter()
+                (latencies, wall), status = await asyncio.gather(
+                    drive(predict, args.concurrency, until=lambda: state['done']), poll())
+                results['predict_during_train'] = scenario_result(latencies, wall)
+                results['train'] = {'status': status['status'], 'seconds': time.perf_counter() - train_start,
+                                    'samples': args.train_samples}
+    return results
+
+
+def run_training_stages(sizes, output_dir):
+    from src.data.generate_data import generate_candidate_data_fast, save_data
+    from src.models.train_model import load_and_preprocess_data, train_svm_models, evaluate_and_save_models
+
+    stages = []
+    for size in sizes:
+        save_data(generate_candidate_data_fast(size))
+        timings = {'samples': size}
+
+        start = time.perf_counter()
+        X_train, X_test, y_train, y_test, scaler = load_and_preprocess_data()
+        timings['load_and_preprocess_data'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        models = train_svm_models(X_train, y_train)
+        timings['train_svm_models'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        evaluate_and_save_models(models, X_test, y_test, output_dir)
+        timings['evaluate_and_save_models'] = time.perf_counter() - start
+        stages.append(timings)
+    return stages
+
+
+def compare(results, baseline, tolerance):
+    """
+    p99 gecikmelerini ve aşama sürelerini temel sonuçlarla karşılaştırır.
+
+    Returns:
+        list: (ölçüm adı, temel, yeni, oran) gerilemeleri
+    """
+    pairs = []
+    for name, scenario in results.get('api', {}).items():
+        base = baseline.get('api', {}).get(name, {})
+        if 'p99_ms' in scenario and 'p99_ms' in base:
+            pairs.append((f"api.{name}.p99_ms", base['p99_ms'], scenario['p99_ms']))
+    base_stages = {s['samples']: s for s in baseline.get('training', [])}
+    for stage in results.get('training', []):
+        base = base_stages.get(stage['samples'], {})
+        for key, value in stage.items():
+            if key != 'samples' and key in base:
+                pairs.append((f"training.{stage['samples']}.{key}", base[key], value))
+    return [(name, old, new, new / old) for name, old, new in pairs if old > 0 and new / old > 1 + tolerance]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=2000, help='/predict istek sayısı')
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--batch-requests', type=int, default=200, help='/predict/batch istek sayısı')
+    parser.add_argument('--train-samples', type=int, default=5000,
+                        help='Eğitim sırasında ölçüm için /train aday sayısı (0: senaryoyu atla)')
+    parser.add_argument('--sizes', type=int, nargs='*', default=[1000, 5000, 20000],
+                        help='Aşama süreleri için veri boyutları (boş: atla)')
+    parser.add_argument('--output', help='Sonuçların yazılacağı JSON dosyası')
+    parser.add_argument('--baseline', help='Karşılaştırılacak önceki JSON sonucu')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='İzin verilen kötüleşme oranı')
+    args = parser.parse_args()
+
+    root = use_isolated_project_root()
+    os.environ['TRAIN_NUM_SAMPLES'] = str(args.train_samples)
+    print(f"Geçici proje dizini: {root}")
+
+    results = {
+        'meta': {
+            'timestamp': time.time(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'args': vars(args),
+        },
+        'api': asyncio.run(run_api(args)),
+        'training': run_training_stages(args.sizes, root / 'src/results'),
+    }
+
+    for name, scenario in results['api'].items():
+        if 'rps' in scenario:
+            print(f"{format_summary(name, scenario)} rps={scenario['rps']:8.1f}")
+    if 'train' in results['api']:
+        print(f"/train: {results['api']['train']['status']} ({results['api']['train']['seconds']:.1f}s)")
+    for stage in results['training']:
+        print(f"{stage['samples']:>8} satır: " + ' '.join(
+            f"{key}={value:.3f}s" for key, value in stage.items() if key != 'samples'))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=4)
+        print(f"Sonuçlar yazıldı: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for name, old, new, ratio in regressions:
+            print(f"⚠️ Gerileme: {name} {old:.3f} -> {new:.3f} ({ratio:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print("✅ Temel sonuçlara göre gerileme yok.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Paralel hiperparametre aramasının seri döngüye göre hızlanmasını ölçer.
+
+Aynı ızgara önce tek çekirdekte ve erken eleme olmadan (seri döngü), sonra
+tüm çekirdeklerde erken eleme ile taranır. Referans olarak varsayılan
+parametrelerle train_svm_models süresi de yazdırılır.
+
+Kullanım:
+    python -m src.benchmarks.train_search --samples 2000 --cv 5
+"""
+import argparse
+import time
+from src.benchmarks.common import use_isolated_project_root
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--samples', type=int, default=2000)
+    parser.add_argument('--cv', type=int, default=5)
+    parser.add_argument('--n-jobs', type=int, default=-1)
+    parser.add_argument('--cutoff', type=float, default=0.05)
+    args = parser.parse_args()
+
+    use_isolated_project_root()
+    from src.data.generate_data import generate_candidate_data, save_data
+    from src.models.train_model import load_and_preprocess_data, train_svm_models, search_svm_models
+
+    save_data(generate_candidate_data(args.samples))
+    X_train, X_test, y_train, y_test, scaler = load_and_preprocess_data()
+
+    start = time.perf_counter()
+    train_svm_models(X_train, y_train)
+    default_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    search_svm_models(X_train, y_train, cv=args.cv, n_jobs=1, cutoff=float('inf'))
+    serial_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    models, results = search_svm_models(X_train, y_train, cv=args.cv, n_jobs=args.n_jobs, cutoff=args.cutoff)
+    parallel_seconds = time.perf_counter() - start
+
+    pruned = sum(r['pruned'] for r in results)
+    print(f"Varsayılan 4 kernel (train_svm_models): {default_seconds:.2f}s")
+    print(f"Seri döngü ({len(results)} konfigürasyon x {args.cv} kat): {serial_seconds:.2f}s")
+    print(f"Paralel + erken eleme ({pruned} konfigürasyon elendi): {parallel_seconds:.2f}s")
+    print(f"Hızlanma: {serial_seconds / parallel_seconds:.2f}x")
+    for kernel, model in models.items():
+        best = max((r for r in results if r['kernel'] == kernel and not r['pruned']),
+                   key=lambda r: r['mean_score'], default=None)
+        if best:
+            print(f"  {kernel:>8}: {best['params']} cv={best['mean_score']:.4f} "
+                  f"test={model.score(X_test, y_test):.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,4 +3,55 @@ from pathlib import Path
 
 class Config:
     # Ortam değişkeninden al, yoksa bu dosyanın 2 üst klasörünü baz al
-    PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT", Path(__file__).resolve().parents[1]))
\ No newline at end of file
+    PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT", Path(__file__).resolve().parents[1]))
+
+    # /predict çıkarımı için sınırlı thread havuzu boyutu
+    INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", 4))
+    # /train çağrısında üretilecek aday sayısı
+    TRAIN_NUM_SAMPLES = int(os.getenv("TRAIN_NUM_SAMPLES", 200))
+    # Artımlı eğitimde (/train?mode=incremental) eklenecek yeni aday sayısı
+    TRAIN_INCREMENTAL_SAMPLES = int(os.getenv("TRAIN_INCREMENTAL_SAMPLES", 200))
+    # /train sırasında paralel hiperparametre araması yapılsın mı ve kaç çekirdek kullanılsın
+    TRAIN_SEARCH = os.getenv("TRAIN_SEARCH", "0") == "1"
+    TRAIN_N_JOBS = int(os.getenv("TRAIN_N_JOBS", -1))
+    # SVC eğitiminden önce tekrarlanan (özellikler, etiket) satırları ağırlıklı tek satıra indirilsin mi (sigmoid hariç)
+    TRAIN_DEDUPLICATE = os.getenv("TRAIN_DEDUPLICATE", "1") == "1"
+    # Hiperparametre aramasında Gram matrisleri bir kez hesaplanıp C değerleri ve katlar arasında paylaşılsın mı
+    TRAIN_GRAM_CACHE = os.getenv("TRAIN_GRAM_CACHE", "0") == "1"
+    # Bu satır sayısından büyük Gram matrisleri diskte memmap olarak tutulur (4096 satır ~128 MB)
+    GRAM_MEMMAP_ROWS = int(os.getenv("GRAM_MEMMAP_ROWS", 4096))
+    # Streamlit istatistik sekmesinin veri kaynağı: .csv, .parquet ya da özellik deposu ('features')
+    STATS_SOURCE = os.getenv("STATS_SOURCE", "candidate_data.csv")
+    # /train sırasında bellek dışı (parça parça, SGD) eğitim kullanılsın mı
+    TRAIN_OUT_OF_CORE = os.getenv("TRAIN_OUT_OF_CORE", "0") == "1"
+    # Karar sınırı görselleri: ızgara çözünürlüğü (kenar başına nokta) ve çizim süreç sayısı (-1: tüm çekirdekler)
+    PLOT_RESOLUTION = int(os.getenv("PLOT_RESOLUTION", 100))
+    PLOT_WORKERS = int(os.getenv("PLOT_WORKERS", -1))
+    # Doğrusal olmayan modeller için karar değeri tablosu (yaklaşık O(1) tahmin) ve ızgara adımları
+    DECISION_GRID = os.getenv("DECISION_GRID", "0") == "1"
+    DECISION_GRID_TECRUBE_STEP = float(os.getenv("DECISION_GRID_TECRUBE_STEP", 0.5))
+    DECISION_GRID_TEKNIK_STEP = float(os.getenv("DECISION_GRID_TEKNIK_STEP", 1.0))
+    # Doğrusal olmayan modeller eğitimden sonra az sayıda dayanak noktasına sıkıştırılıp
+    # API'de sklearn'süz skorlayıcıyla sunulsun mu (yaklaşıktır; uyum eşiği aşağıda)
+    REDUCED_SCORER = os.getenv("REDUCED_SCORER", "0") == "1"
+    REDUCED_MIN_AGREEMENT = float(os.getenv("REDUCED_MIN_AGREEMENT", 0.9999))
+    # /predict sonuç önbelleği: en fazla kayıt sayısı (0: kapalı), TTL (saniye, 0: süresiz) ve anahtar hassasiyeti
+    PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", 10000))
+    PREDICTION_CACHE_TTL = float(os.getenv("PREDICTION_CACHE_TTL", 0))
+    PREDICTION_CACHE_DECIMALS = int(os.getenv("PREDICTION_CACHE_DECIMALS", 6))
+    # /predict mikro toplu işlem (isteğe bağlı): eşzamanlı tekil istekler en fazla MAX_WAIT_MS
+    # milisaniye ya da MAX_SIZE aday birikene kadar bekletilip tek vektörel çağrıyla skorlanır
+    MICRO_BATCH = os.getenv("MICRO_BATCH", "0") == "1"
+    MICRO_BATCH_MAX_SIZE = int(os.getenv("MICRO_BATCH_MAX_SIZE", 64))
+    MICRO_BATCH_MAX_WAIT_MS = float(os.getenv("MICRO_BATCH_MAX_WAIT_MS", 2.0))
+    # API'nin yükleyeceği model (varsayılan data/best_model_linear.joblib); yoksa DEFAULT_MODEL_PATH (paketle gelen varsayılan) denenir,
+    # o da yoksa API açılışta hata verir (açılışta veri üretilip model eğitilmez)
+    MODEL_PATH = os.getenv("MODEL_PATH")
+    DEFAULT_MODEL_PATH = os.getenv("DEFAULT_MODEL_PATH")
+    # Çok worker'lı sunum: uvicorn worker sayısı, modellerin bellek eşlemeli yüklenmesi
+    # ve etkin model işaretçisinin kaç saniyede bir kontrol edileceği
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))
+    MODEL_MMAP = os.getenv("MODEL_MMAP", "1") == "1"
+    MODEL_CHECK_INTERVAL = float(os.getenv("MODEL_CHECK_INTERVAL", 1.0))
+    # Süre histogramları ve sayaçlar (/metrics); kapatıldığında ölçüm çağrıları hemen döner
+    METRICS = os.getenv("METRICS", "1") == "1"
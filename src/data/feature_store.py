@@ -0,0 +1,142 @@
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from src.config import Config
+
+FEATURE_COLUMNS = ['tecrube_yili', 'teknik_puan']
+LABEL_COLUMN = 'etiket'
+
+# Depoda tutulan sayısal sütunlar ve disk üzerindeki tipleri
+STORE_COLUMNS = {
+    'mezuniyet_yili': np.int16,
+    'tecrube_yili': np.float64,
+    'teknik_puan': np.float64,
+    'etiket': np.int8,
+}
+
+
+def _count_rows(path):
+    if path.suffix == '.parquet':
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+
+    # CSV: başlık hariç satır sayısı (metin sütunlarında satır sonu bulunmaz)
+    count = 0
+    last = b'\n'
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 24), b''):
+            count += block.count(b'\n')
+            last = block[-1:]
+    if last != b'\n':
+        count += 1
+    return count - 1
+
+
+def iter_columns(filename, columns, chunksize=100_000):
+    """
+    Aday verisinin istenen sütunlarını parça parça okur (generator).
+
+    Args:
+        filename (str): data/ altındaki .csv, .parquet dosyası ya da özellik deposu adı
+        columns (list): Okunacak sütunlar
+        chunksize (int): Parça başına satır sayısı
+
+    Yields:
+        pd.DataFrame: En fazla chunksize satırlık parça
+    """
+    path = Config.PROJECT_ROOT / f'data/{filename}'
+    if path.suffix == '.parquet':
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    elif path.suffix == '.csv':
+        for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+            yield chunk[columns]
+    else:
+        store = load_feature_store(filename, columns)
+        n = len(store[columns[0]])
+        for start in range(0, n, chunksize):
+            yield pd.DataFrame({column: store[column][start:start + chunksize] for column in columns})
+
+
+def build_feature_store(filename='candidate_data.csv', store_name='features', chunksize=1_000_000):
+    """
+    Aday dosyasındaki sayısal sütunları sütun başına bir .npy dosyasına yazar.
+
+    Kaynak dosya parça parça ve yalnızca gerekli sütunlar okunarak işlenir; metin
+    sütunları (isim, üniversite, doğum tarihi) hiç ayrıştırılmaz. Depo önce geçici
+    bir klasöre yazılır ve tamamlanınca yerine taşınır.
+
+    Args:
+        filename (str): data/ altındaki kaynak dosya (.csv ya da .parquet)
+        store_name (str): data/ altındaki depo klasörü
+        chunksize (int): Parça başına satır sayısı
+
+    Returns:
+        Path: Depo klasörü
+    """
+    source = Config.PROJECT_ROOT / f'data/{filename}'
+    store_dir = Config.PROJECT_ROOT / f'data/{store_name}'
+    tmp_dir = store_dir.with_name(store_dir.name + '.tmp')
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    n = _count_rows(source)
+    arrays = {
+        column: np.lib.format.open_memmap(tmp_dir / f'{column}.npy', mode='w+', dtype=dtype, shape=(n,))
+        for column, dtype in STORE_COLUMNS.items()
+    }
+
+    offset = 0
+    for chunk in iter_columns(filename, list(STORE_COLUMNS), chunksize):
+        end = offset + len(chunk)
+        for column, array in arrays.items():
+            array[offset:end] = chunk[column].to_numpy()
+        offset = end
+
+    for array in arrays.values():
+        array.flush()
+    del arrays
+
+    shutil.rmtree(store_dir, ignore_errors=True)
+    os.replace(tmp_dir, store_dir)
+    print(f"Özellik deposu oluşturuldu: {store_dir} ({n} satır)")
+    return store_dir
+
+
+def load_feature_store(store_name='features', columns=None, mmap_mode='r'):
+    """
+    Özellik deposundaki sütunları kopyalamadan, bellek eşlemeli olarak açar.
+
+    Args:
+        store_name (str): data/ altındaki depo klasörü
+        columns (list): Yüklenecek sütunlar (varsayılan: tümü)
+        mmap_mode (str): np.load için mmap modu; None verilirse belleğe okunur
+
+    Returns:
+        dict: sütun adı -> np.ndarray (np.memmap)
+    """
+    store_dir = Config.PROJECT_ROOT / f'data/{store_name}'
+    columns = columns or list(STORE_COLUMNS)
+    return {column: np.load(store_dir / f'{column}.npy', mmap_mode=mmap_mode) for column in columns}
+
+
+def read_columns(filename, columns):
+    """
+    Aday verisinden yalnızca istenen sütunları okur.
+
+    Kaynak uzantısına göre seçilir: .parquet için sütun projeksiyonu, .csv için
+    usecols, uzantısız ad için özellik deposu. Depodan okunan sütunlar
+    kopyalanmaz; DataFrame sütunları salt okunur memmap'lerin görünümleridir ve
+    veri ancak erişildikçe diskten sayfalanır.
+
+    Returns:
+        pd.DataFrame: İstenen sütunlar
+    """
+    path = Config.PROJECT_ROOT / f'data/{filename}'
+    if path.suffix == '.parquet':
+        return pd.read_parquet(path, columns=columns)
+    if path.suffix == '.csv':
+        return pd.read_csv(path, usecols=columns)[columns]
+    return pd.DataFrame(load_feature_store(filename, columns), copy=False)
@@ -1,8 +1,27 @@
+import os
+import time
 import numpy as np
 import pandas as pd
 from faker import Faker
-from datetime import datetime, timedelta
+from pathlib import Path
+from datetime import datetime, timedelta, date
+from concurrent.futures import ProcessPoolExecutor
 from src.config import Config
+from src import metrics
+
+BOLUMLER = (
+    "Bilgisayar Mühendisliği",
+    "Yazılım Mühendisliği",
+    "Elektrik-Elektronik Mühendisliği",
+    "Bilgisayar Bilimleri",
+    "Matematik Mühendisliği"
+)
+
+GENERATION_SECONDS = metrics.histogram(
+    'data_generation_seconds', 'Aday verisi üretim süresi', metrics.STAGE_BUCKETS)
+WRITE_SECONDS = metrics.histogram(
+    'data_write_seconds', 'Aday verisinin diske yazılma süresi', metrics.STAGE_BUCKETS)
+GENERATED_ROWS = metrics.counter('generated_rows_total', 'Üretilen aday satırı sayısı')
 
 def generate_candidate_data(num_samples=200):
     """
@@ -14,6 +33,7 @@ def generate_candidate_data(num_samples=200):
     Returns:
         pd.DataFrame: Aday verilerini içeren DataFrame
     """
+    started = time.perf_counter()
     fake = Faker('tr_TR')
     Faker.seed(42)  # Tekrarlanabilirlik için
     
@@ -34,13 +54,7 @@ def generate_candidate_data(num_samples=200):
         
         # Eğitim bilgileri
         universite.append(fake.company() + " Üniversitesi")
-        bolum.append(fake.random_element(elements=(
-            "Bilgisayar Mühendisliği",
-            "Yazılım Mühendisliği",
-            "Elektrik-Elektronik Mühendisliği",
-            "Bilgisayar Bilimleri",
-            "Matematik Mühendisliği"
-        )))
+        bolum.append(fake.random_element(elements=BOLUMLER))
         
         # Mezuniyet yılı (2010-2023 arası)
         mezuniyet = fake.random_int(min=2010, max=2023)
@@ -72,9 +86,182 @@ def generate_candidate_data(num_samples=200):
         'teknik_puan': teknik_puan,
         'etiket': etiket
     })
+    GENERATION_SECONDS.observe(time.perf_counter() - started, generator='faker')
+    GENERATED_ROWS.inc(num_samples, generator='faker')
     
     return data
 
+def _string_pools(pool_size, seed):
+    # Faker yalnızca küçük bir isim/üniversite havuzu için çağrılır
+    fake = Faker('tr_TR')
+    fake.seed_instance(seed)
+    names = np.array([fake.name() for _ in range(pool_size)], dtype=object)
+    universities = np.array([fake.company() + " Üniversitesi" for _ in range(pool_size)], dtype=object)
+    return names, universities
+
+def _generate_chunk(num_samples, seed, names, universities):
+    rng = np.random.default_rng(seed)
+
+    # Sayısal sütunlar generate_candidate_data ile aynı aralık ve kurallarla
+    mezuniyet_yili = rng.integers(2010, 2024, num_samples)
+    tecrube_yili = rng.integers(0, 11, num_samples)
+    base_score = rng.integers(30, 91, num_samples)
+    teknik_puan = np.minimum(100, base_score + tecrube_yili * 2 + (2023 - mezuniyet_yili))
+    etiket = np.where((tecrube_yili < 2) & (teknik_puan < 60), 1, 0)
+
+    # 22-45 yaş aralığında doğum tarihi
+    today = np.datetime64(date.today(), 'D')
+    age_days = rng.integers(22 * 365, 46 * 365, num_samples)
+    dogum_tarihi = today - age_days.astype('timedelta64[D]')
+
+    return pd.DataFrame({
+        'ad_soyad': names[rng.integers(0, len(names), num_samples)],
+        'dogum_tarihi': dogum_tarihi,
+        'universite': universities[rng.integers(0, len(universities), num_samples)],
+        'bolum': np.array(BOLUMLER, dtype=object)[rng.integers(0, len(BOLUMLER), num_samples)],
+        'mezuniyet_yili': mezuniyet_yili,
+        'tecrube_yili': tecrube_yili,
+        'teknik_puan': teknik_puan,
+        'etiket': etiket
+    })
+
+def _chunk_plan(num_samples, chunk_size, seed):
+    # Parça boyutları ve her parçanın bağımsız tohumu
+    sizes = [min(chunk_size, num_samples - start) for start in range(0, num_samples, chunk_size)] or [0]
+    return sizes, np.random.SeedSequence(seed).spawn(len(sizes))
+
+def generate_candidate_data_fast(num_samples=200, seed=42, n_jobs=1, chunk_size=250_000, pool_size=1000):
+    """
+    Aday verilerini vektörel olarak oluşturur; milyonlarca satır için uygundur.
+
+    Sayısal sütunlar NumPy RNG ile toplu çekilir, isim ve üniversite gibi metin
+    sütunları Faker ile bir kez üretilen küçük bir havuzdan örneklenir. Etiket
+    kuralı generate_candidate_data ile aynıdır. Veri parçalar halinde üretilir;
+    her parçanın tohumu `seed`'den türetildiği için sonuç n_jobs'tan bağımsızdır.
+
+    Args:
+        num_samples (int): Oluşturulacak örnek sayısı
+        seed (int): Tekrarlanabilirlik için tohum
+        n_jobs (int): Parçaları paralel üretecek süreç sayısı (-1: tüm çekirdekler)
+        chunk_size (int): Parça başına satır sayısı
+        pool_size (int): İsim/üniversite havuzunun boyutu
+
+    Returns:
+        pd.DataFrame: Aday verilerini içeren DataFrame
+    """
+    started = time.perf_counter()
+    names, universities = _string_pools(pool_size, seed)
+    sizes, seeds = _chunk_plan(num_samples, chunk_size, seed)
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    if n_jobs > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            chunks = list(executor.map(_generate_chunk, sizes, seeds,
+                                       [names] * len(sizes), [universities] * len(sizes)))
+    else:
+        chunks = [_generate_chunk(size, chunk_seed, names, universities)
+                  for size, chunk_seed in zip(sizes, seeds)]
+
+    data = pd.concat(chunks, ignore_index=True)
+    GENERATION_SECONDS.observe(time.perf_counter() - started, generator='vectorized')
+    GENERATED_ROWS.inc(num_samples, generator='vectorized')
+    return data
+
+def iter_candidate_chunks(num_samples, chunk_size=100_000, seed=42, pool_size=1000):
+    """
+    Aday verilerini sabit boyutlu parçalar halinde üretir (generator).
+
+    Aynı seed ve chunk_size ile parçaların birleşimi generate_candidate_data_fast
+    çıktısıyla aynıdır; ancak bellekte aynı anda yalnızca bir parça bulunur.
+
+    Yields:
+        pd.DataFrame: En fazla chunk_size satırlık parça
+    """
+    names, universities = _string_pools(pool_size, seed)
+    sizes, seeds = _chunk_plan(num_samples, chunk_size, seed)
+    # num_samples=0 için tek bir boş parça üretilir; dosyaya yalnızca başlık/şema yazılır
+    for size, chunk_seed in zip(sizes, seeds):
+        yield _generate_chunk(size, chunk_seed, names, universities)
+
+def write_chunks(chunks, path, fmt=None):
+    """
+    DataFrame parçalarını üretildikçe diske ekler; tepe bellek parça boyutuyla sınırlıdır.
+
+    Dosya önce geçici bir ada yazılır ve iş bitince yerine taşınır; okuyucular
+    hiçbir zaman yarım yazılmış dosya görmez. Hata durumunda geçici dosya
+    silinir; hiç parça gelmezse boş bir dosya yazılır.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Yazılacak parçalar
+        path (str | Path): Hedef dosya
+        fmt (str): 'csv' ya da 'parquet' (varsayılan: dosya uzantısından)
+
+    Returns:
+        int: Yazılan toplam satır sayısı
+    """
+    path = Path(path)
+    fmt = fmt or path.suffix.lstrip('.').lower()
+    if fmt not in ('csv', 'parquet'):
+        raise ValueError(f"Desteklenmeyen format: {fmt}")
+
+    started = time.perf_counter()
+    tmp_path = path.with_name(path.name + '.tmp')
+    total = 0
+    if fmt == 'parquet':
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet çıktısı için 'pyarrow' paketi gereklidir.") from e
+
+    try:
+        if fmt == 'csv':
+            # Dosya baştan açılır; hiç parça gelmezse boş dosya yazılır
+            with open(tmp_path, 'w', newline='') as f:
+                for i, chunk in enumerate(chunks):
+                    chunk.to_csv(f, header=(i == 0), index=False)
+                    total += len(chunk)
+        else:
+            writer = None
+            try:
+                for chunk in chunks:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(tmp_path, table.schema)
+                    writer.write_table(table)
+                    total += len(chunk)
+            finally:
+                if writer is not None:
+                    writer.close()
+            if writer is None:
+                pq.write_table(pa.table({}), tmp_path)
+    except BaseException:
+        # Yarım yazılmış geçici dosya bırakılmaz
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    os.replace(tmp_path, path)
+    # Akış halinde yazımda süre parça üretimini de içerir
+    WRITE_SECONDS.observe(time.perf_counter() - started, format=fmt, mode='streaming')
+    GENERATED_ROWS.inc(total, generator='streaming')
+    return total
+
+def save_data_streaming(num_samples, filename='candidate_data.csv', chunk_size=100_000, seed=42, fmt=None):
+    """
+    Aday verisini parça parça üretip doğrudan diske yazar.
+
+    Args:
+        num_samples (int): Oluşturulacak örnek sayısı
+        filename (str): data/ altındaki dosya adı (.csv ya da .parquet)
+        chunk_size (int): Parça başına satır sayısı
+        seed (int): Tekrarlanabilirlik için tohum
+        fmt (str): 'csv' ya da 'parquet' (varsayılan: dosya uzantısından)
+    """
+    path = Config.PROJECT_ROOT / f'data/{filename}'
+    total = write_chunks(iter_candidate_chunks(num_samples, chunk_size, seed), path, fmt)
+    print(f"Veri başarıyla kaydedildi: {filename} ({total} satır)")
+
 def save_data(data, filename='candidate_data.csv'):
     """
     Veriyi CSV dosyasına kaydeder.
@@ -83,9 +270,23 @@ def save_data(data, filename='candidate_data.csv'):
         data (pd.DataFrame): Kaydedilecek veri
         filename (str): Dosya adı
     """
-    data.to_csv(Config.PROJECT_ROOT / f'data/{filename}', index=False)
+    with WRITE_SECONDS.time(format='csv', mode='write'):
+        data.to_csv(Config.PROJECT_ROOT / f'data/{filename}', index=False)
     print(f"Veri başarıyla kaydedildi: {filename}")
 
+def append_data(data, filename='candidate_data.csv'):
+    """
+    Yeni gelen aday kayıtlarını mevcut CSV dosyasının sonuna ekler.
+
+    Args:
+        data (pd.DataFrame): Eklenecek yeni kayıtlar
+        filename (str): Dosya adı
+    """
+    path = Config.PROJECT_ROOT / f'data/{filename}'
+    with WRITE_SECONDS.time(format='csv', mode='append'):
+        data.to_csv(path, mode='a', header=not path.exists(), index=False)
+    print(f"{len(data)} yeni kayıt eklendi: {filename}")
+
 if __name__ == "__main__":
     # Veri oluştur ve kaydet
     data = generate_candidate_data()
@@ -0,0 +1,199 @@
+"""
+Hafif süreç içi metrikler: sayaçlar, göstergeler ve histogramlar.
+
+Metrikler modül düzeyinde bir kez tanımlanır ve sıcak yolda yalnızca
+inc/observe çağrılır. Config.METRICS kapalıysa bu çağrılar hemen döner.
+/metrics endpoint'i render() çıktısını Prometheus metin biçiminde sunar.
+Eğitim ayrı bir süreçte çalıştığı için oradaki gözlemler snapshot() ile
+alınıp API sürecinde merge() ile birleştirilir.
+"""
+import math
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from src.config import Config
+
+# Gecikme (saniye) için varsayılan kova sınırları: 50µs - 10s
+LATENCY_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Eğitim aşamaları (saniye) için kova sınırları: 10ms - 10dk
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key, extra=None):
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    body = ','.join(f'{name}="{str(value)}"' for name, value in pairs)
+    return '{' + body + '}'
+
+
+class Counter:
+    type = 'counter'
+
+    def __init__(self, name, help):
+        self.name, self.help = name, help
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        if not Config.METRICS:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+    def merge(self, values):
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] = self._values.get(key, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def render(self):
+        return [f'{self.name}{_format_labels(key)} {value}' for key, value in self.snapshot().items()]
+
+
+class Gauge(Counter):
+    type = 'gauge'
+
+    def set(self, value, **labels):
+        if not Config.METRICS:
+            return
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def merge(self, values):
+        # Göstergelerde son değer geçerlidir
+        with self._lock:
+            self._values.update(values)
+
+
+class Histogram:
+    type = 'histogram'
+
+    def __init__(self, name, help, buckets=LATENCY_BUCKETS):
+        self.name, self.help = name, help
+        self.buckets = tuple(buckets)
+        # Etiket -> [kova sayıları..., +Inf sayısı, toplam]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        if not Config.METRICS:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            # value <= sınır olan ilk kova; hiçbiri değilse +Inf
+            counts[bisect_left(self.buckets, value)] += 1
+            counts[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def snapshot(self):
+        with self._lock:
+            return {key: list(counts) for key, counts in self._values.items()}
+
+    def merge(self, values):
+        with self._lock:
+            for key, counts in values.items():
+                current = self._values.setdefault(key, [0] * (len(self.buckets) + 1) + [0.0])
+                for i, count in enumerate(counts):
+                    current[i] += count
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def render(self):
+        lines = []
+        for key, counts in self.snapshot().items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts[:-1]):
+                cumulative += count
+                le = '+Inf' if bound == math.inf else repr(bound)
+                lines.append(f'{self.name}_bucket{_format_labels(key, ("le", le))} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(key)} {counts[-1]}')
+            lines.append(f'{self.name}_count{_format_labels(key)} {cumulative}')
+        return lines
+
+
+def _get_or_create(cls, name, help, **kwargs):
+    # Aynı isim ikinci kez tanımlanırsa mevcut metrik döner (modül yeniden yüklemeleri)
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = _registry[name] = cls(name, help, **kwargs)
+        return metric
+
+
+def counter(name, help):
+    return _get_or_create(Counter, name, help)
+
+
+def gauge(name, help):
+    return _get_or_create(Gauge, name, help)
+
+
+def histogram(name, help, buckets=LATENCY_BUCKETS):
+    return _get_or_create(Histogram, name, help, buckets=buckets)
+
+
+def snapshot():
+    """Tüm metriklerin pickle edilebilir kopyası (ör. eğitim sürecinden API'ye taşımak için)."""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    return {m.name: (m.type, m.help, getattr(m, 'buckets', None), m.snapshot()) for m in metrics}
+
+
+def merge(data):
+    """snapshot() çıktısını bu sürecin metriklerine ekler."""
+    factories = {'counter': counter, 'gauge': gauge}
+    for name, (kind, help, buckets, values) in data.items():
+        if kind == 'histogram':
+            metric = histogram(name, help, buckets)
+        else:
+            metric = factories[kind](name, help)
+        metric.merge(values)
+
+
+def reset():
+    with _registry_lock:
+        metrics = list(_registry.values())
+    for metric in metrics:
+        metric.reset()
+
+
+def render():
+    """Tüm metrikleri Prometheus metin biçiminde döndürür."""
+    with _registry_lock:
+        metrics = sorted(_registry.values(), key=lambda m: m.name)
+    lines = []
+    for metric in metrics:
+        lines.append(f'# HELP {metric.name} {metric.help}')
+        lines.append(f'# TYPE {metric.name} {metric.type}')
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,145 @@
+import hashlib
+import time
+import numpy as np
+from pathlib import Path
+from dataclasses import dataclass, field, replace
+from src.config import Config
+from src.models.decision_grid import DecisionGrid
+from src.models.linear_scorer import LinearScorer, coefficient_path
+from src.models.reduced_scorer import ReducedKernelScorer, reduced_path
+from src.models.inference import scale_features, score_candidate
+
+
+@dataclass(frozen=True)
+class ModelBundle:
+    """
+    Birlikte kullanılması gereken model ve scaler'ı tek, değiştirilemez bir
+    nesnede tutar. API bu nesneyi tek bir atama ile değiştirir; böylece
+    eşzamanlı bir tahmin hiçbir zaman yeni model ile eski scaler'ı
+    (ya da tersini) birlikte görmez.
+
+    Kapalı form ya da sıkıştırılmış skorlayıcı ile yüklenen paketlerde model
+    ve scaler None'dır.
+    """
+    model: object
+    scaler: object
+    version: str
+    kernel: str
+    path: str = ''
+    # sklearn'ü atlayan skorlayıcı (varsa): doğrusal modeller için kapalı form,
+    # diğerleri için sıkıştırılmış (ReducedKernelScorer)
+    scorer: object = None
+    # Doğrusal olmayan modeller için isteğe bağlı karar değeri tablosu
+    grid: object = None
+    loaded_at: float = field(default_factory=time.time)
+
+    def exact_decision_function(self, X):
+        if self.scorer is not None:
+            return self.scorer.decision_function(X)
+        return self.model.decision_function(scale_features(self.scaler, X))
+
+    def decision_function(self, X):
+        if self.grid is not None:
+            return self.grid.decision_function(X, self.exact_decision_function)
+        return self.exact_decision_function(X)
+
+    @property
+    def serving_path(self):
+        # Tahminin hangi yoldan hesaplandığı (metrik etiketi olarak kullanılır)
+        if self.scorer is not None:
+            return self.scorer.serving_path
+        return 'grid' if self.grid is not None else 'model'
+
+    @property
+    def classes(self):
+        return self.scorer.classes if self.scorer is not None else self.model.classes_
+
+    def predict_candidates(self, X):
+        decision = self.decision_function(X)
+        return self.classes[(decision > 0).astype(int)], np.abs(decision)
+
+    def score_candidate(self, tecrube_yili, teknik_puan):
+        if self.scorer is not None:
+            return self.scorer.score_candidate(tecrube_yili, teknik_puan)
+        if self.grid is None:
+            return score_candidate(self.model, self.scaler, tecrube_yili, teknik_puan)
+
+        decision = self.grid.decision_one(tecrube_yili, teknik_puan, self.exact_decision_function)
+        classes = self.classes
+        return (classes[1] if decision > 0 else classes[0]), abs(decision)
+
+    def info(self):
+        return {
+            'version': self.version,
+            'kernel': self.kernel,
+            'path': self.path,
+            'loaded_at': self.loaded_at,
+            'closed_form': self.serving_path == 'closed_form',
+            'reduced': self.scorer.report if self.serving_path == 'reduced' else None,
+            'decision_grid': self.grid.info() if self.grid is not None else None
+        }
+
+
+def file_digest(path):
+    """Dosya içeriğinin sha256 özetini döndürür."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_bundle(path, decision_grid=None):
+    """
+    joblib ile kaydedilmiş (model, scaler) ikilisini ModelBundle olarak yükler.
+
+    Sürüm, dosya içeriğinin özetinden türetilir; aynı dosyayı yükleyen her
+    süreç aynı sürümü görür. Yanında bu dosyaya ait bir katsayı dosyası
+    (.coef.json) ya da Config.REDUCED_SCORER açıkken sıkıştırılmış skorlayıcı
+    (.reduced.json) varsa yalnızca o yüklenir; pickle hiç açılmadığı için
+    sklearn de yüklenmez. Aksi halde model joblib ile açılır
+    ve tablo modu açıksa karar değeri tablosu her yüklemede yeniden hesaplanır.
+
+    Args:
+        path (str | Path): best_model_<kernel>.joblib dosyası
+        decision_grid (bool): Karar değeri tablosu kurulsun mu (varsayılan Config.DECISION_GRID)
+
+    Returns:
+        ModelBundle: Yüklenen model paketi
+    """
+    path = Path(path)
+    digest = file_digest(path)
+
+    scorer = None
+    if coefficient_path(path).exists():
+        candidate = LinearScorer.load(coefficient_path(path))
+        if candidate.source_digest == digest:
+            scorer = candidate
+    if scorer is None and Config.REDUCED_SCORER and reduced_path(path).exists():
+        candidate = ReducedKernelScorer.load(reduced_path(path))
+        if candidate.source_digest == digest:
+            scorer = candidate
+
+    model = scaler = None
+    if scorer is None:
+        import joblib
+        # Bellek eşlemeli yükleme: aynı makinedeki tüm worker'lar model dizilerini
+        # işletim sisteminin sayfa önbelleği üzerinden paylaşır
+        model, scaler = joblib.load(path, mmap_mode='r' if Config.MODEL_MMAP else None)
+
+    bundle = ModelBundle(
+        model=model,
+        scaler=scaler,
+        version=digest[:12],
+        kernel=scorer.kernel if scorer is not None else getattr(model, 'kernel', path.stem.replace('best_model_', '')),
+        path=str(path),
+        scorer=scorer
+    )
+
+    if decision_grid is None:
+        decision_grid = Config.DECISION_GRID
+    if decision_grid and scorer is None:
+        grid = DecisionGrid.build(bundle.exact_decision_function,
+                                  Config.DECISION_GRID_TECRUBE_STEP, Config.DECISION_GRID_TEKNIK_STEP)
+        bundle = replace(bundle, grid=grid)
+    return bundle
@@ -0,0 +1,108 @@
+import math
+import numpy as np
+
+# Girdi uzayının sınırları (API doğrulamasıyla aynı)
+TECRUBE_MAX = 10.0
+TEKNIK_MAX = 100.0
+
+
+class DecisionGrid:
+    """
+    Karar fonksiyonunun sabit bir ızgara üzerinde önceden hesaplanmış değerleri.
+
+    Izgara düğümlerindeki (ör. Streamlit kaydırıcılarının 0.5 / 1.0 adımları)
+    sorgular tablodan birebir okunur, aradaki noktalar çift doğrusal (bilinear)
+    interpolasyonla yaklaşık hesaplanır. Yaklaşık karar değeri marjdan küçük
+    kalan, yani etiketi interpolasyon hatasıyla değişebilecek noktalar için
+    kesin karar fonksiyonuna geri dönülür.
+    """
+
+    def __init__(self, values, tecrube_step, teknik_step, max_error, margin):
+        self.values = values
+        self.tecrube_step = tecrube_step
+        self.teknik_step = teknik_step
+        self.max_error = max_error
+        self.margin = margin
+        # Tek aday yolu için düz Python listesi (numpy skaler maliyeti olmadan)
+        self._rows = values.tolist()
+
+    @classmethod
+    def build(cls, decision_function, tecrube_step=0.5, teknik_step=1.0, safety=2.0):
+        """
+        Izgarayı hesaplar ve interpolasyon hatasını ölçer.
+
+        Hata, her hücrenin merkezi ve kenar orta noktalarında kesin değerle
+        karşılaştırılarak bulunur. Geri dönüş marjı bu hatanın `safety` katıdır;
+        analitik değil, ölçüme dayalı bir sınırdır.
+
+        Args:
+            decision_function (callable): (n, 2) ham girdi -> karar değerleri
+            tecrube_step (float): Tecrübe ekseni adımı
+            teknik_step (float): Teknik puan ekseni adımı
+            safety (float): Marj için hata çarpanı
+
+        Returns:
+            DecisionGrid: Hazır tablo
+        """
+        tecrube_axis = np.arange(math.ceil(TECRUBE_MAX / tecrube_step) + 1) * tecrube_step
+        teknik_axis = np.arange(math.ceil(TEKNIK_MAX / teknik_step) + 1) * teknik_step
+        T, P = np.meshgrid(tecrube_axis, teknik_axis, indexing='ij')
+        values = decision_function(np.column_stack([T.ravel(), P.ravel()])).reshape(T.shape)
+
+        grid = cls(values, tecrube_step, teknik_step, 0.0, 0.0)
+
+        # Hücre merkezleri ve kenar ortaları
+        t_mid = tecrube_axis[:-1] + tecrube_step / 2
+        p_mid = teknik_axis[:-1] + teknik_step / 2
+        probes = [np.meshgrid(t_mid, p_mid, indexing='ij'),
+                  np.meshgrid(t_mid, teknik_axis, indexing='ij'),
+                  np.meshgrid(tecrube_axis, p_mid, indexing='ij')]
+        X = np.concatenate([np.column_stack([a.ravel(), b.ravel()]) for a, b in probes])
+        max_error = float(np.max(np.abs(grid.interpolate(X) - decision_function(X))))
+
+        grid.max_error = max_error
+        grid.margin = safety * max_error
+        return grid
+
+    def interpolate(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        n_t, n_p = self.values.shape
+        fi = X[:, 0] / self.tecrube_step
+        fj = X[:, 1] / self.teknik_step
+        i0 = np.clip(np.floor(fi).astype(int), 0, n_t - 2)
+        j0 = np.clip(np.floor(fj).astype(int), 0, n_p - 2)
+        di, dj = fi - i0, fj - j0
+        v = self.values
+        return (v[i0, j0] * (1 - di) * (1 - dj) + v[i0 + 1, j0] * di * (1 - dj)
+                + v[i0, j0 + 1] * (1 - di) * dj + v[i0 + 1, j0 + 1] * di * dj)
+
+    def decision_function(self, X, exact):
+        """Tablodan karar değerleri; marj içindeki noktalar `exact` ile hesaplanır."""
+        decision = self.interpolate(X)
+        near = np.abs(decision) <= self.margin
+        if near.any():
+            decision[near] = exact(np.asarray(X, dtype=np.float64)[near])
+        return decision
+
+    def decision_one(self, tecrube_yili, teknik_puan, exact):
+        fi = tecrube_yili / self.tecrube_step
+        fj = teknik_puan / self.teknik_step
+        i0 = min(max(int(fi), 0), len(self._rows) - 2)
+        j0 = min(max(int(fj), 0), len(self._rows[0]) - 2)
+        di, dj = fi - i0, fj - j0
+        r0, r1 = self._rows[i0], self._rows[i0 + 1]
+        decision = (r0[j0] * (1 - di) * (1 - dj) + r1[j0] * di * (1 - dj)
+                    + r0[j0 + 1] * (1 - di) * dj + r1[j0 + 1] * di * dj)
+        if abs(decision) <= self.margin:
+            decision = float(exact([[tecrube_yili, teknik_puan]])[0])
+        return decision
+
+    def info(self):
+        return {
+            'shape': list(self.values.shape),
+            'tecrube_step': self.tecrube_step,
+            'teknik_step': self.teknik_step,
+            'nbytes': int(self.values.nbytes),
+            'max_error': self.max_error,
+            'margin': self.margin
+        }
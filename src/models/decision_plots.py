@@ -0,0 +1,145 @@
+import os
+import json
+import pickle
+import hashlib
+import numpy as np
+from pathlib import Path
+from src.config import Config
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _array_digest(*arrays):
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.dtype, array.shape)).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def model_digest(model):
+    """Eğitilmiş modelin içerik özeti (pickle baytlarından)."""
+    return hashlib.sha256(pickle.dumps(model, protocol=4)).hexdigest()
+
+
+def decision_grid(X, resolution):
+    """
+    Tüm kernel'ler için ortak değerlendirme ızgarası. Sınırlar matplotlib'in
+    otomatik eksen sınırlarıyla aynıdır (veri aralığı + %5 pay).
+
+    Returns:
+        tuple: (xx, yy, xy) — eksen değerleri ve (resolution*resolution, 2) nokta dizisi
+    """
+    lo, hi = X.min(axis=0), X.max(axis=0)
+    pad = (hi - lo) * 0.05
+    xx = np.linspace(lo[0] - pad[0], hi[0] + pad[0], resolution)
+    yy = np.linspace(lo[1] - pad[1], hi[1] + pad[1], resolution)
+    YY, XX = np.meshgrid(yy, xx)
+    return xx, yy, np.column_stack([XX.ravel(), YY.ravel()])
+
+
+def _render(task):
+    # Ayrı süreçte, etkileşimsiz Agg arka ucuyla çizer
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    kernel_name, X, y, xx, yy, Z, plot_path, dpi = task
+    fig = plt.figure(figsize=(10, 6))
+    plt.scatter(X[:, 0], X[:, 1], c=y, cmap='coolwarm', alpha=0.6)
+    ax = plt.gca()
+    ax.set_xlim(xx[0], xx[-1])
+    ax.set_ylim(yy[0], yy[-1])
+    if Z is not None:
+        YY, XX = np.meshgrid(yy, xx)
+        ax.contour(XX, YY, Z, colors='k', levels=[-1, 0, 1],
+                   alpha=0.5, linestyles=['--', '-', '--'])
+
+    plt.xlabel('Tecrübe Yılı (Ölçeklendirilmiş)')
+    plt.ylabel('Teknik Puan (Ölçeklendirilmiş)')
+    plt.title(f'SVM Karar Sınırı - {kernel_name}')
+    # Geçici dosyaya yazıp yerine taşı: Streamlit yarım yazılmış görsel okumaz
+    tmp_path = plot_path.with_name(plot_path.stem + '.tmp.png')
+    plt.savefig(tmp_path, dpi=dpi)
+    plt.close(fig)
+    os.replace(tmp_path, plot_path)
+    return kernel_name
+
+
+def render_decision_boundaries(models, X, y, output_dir, resolution=None, n_jobs=None,
+                               max_points=20_000, dpi=None):
+    """
+    Tüm modellerin karar sınırı görsellerini üretir.
+
+    Izgara bir kez oluşturulur ve her modelin karar değerleri ana süreçte
+    toplu hesaplanır; çizimler paralel süreçlerde yapılır. Model özeti, veri
+    özeti ve çizim ayarları değişmemişse mevcut görsel yeniden çizilmez
+    (anahtarlar output_dir/decision_boundary_cache.json içinde tutulur).
+
+    Args:
+        models (dict): Kernel adı -> eğitilmiş model
+        X (np.ndarray): Ölçeklendirilmiş özellikler (2 sütun)
+        y: Etiketler
+        output_dir (str | Path): decision_boundary_<kernel>.png dosyalarının klasörü
+        resolution (int): Izgaranın kenar başına nokta sayısı (varsayılan Config.PLOT_RESOLUTION)
+        n_jobs (int): Çizim süreç sayısı (-1: tüm çekirdekler, varsayılan Config.PLOT_WORKERS)
+        max_points (int): Saçılım grafiğinde gösterilecek en fazla nokta (çizim süresini sınırlar)
+        dpi (int): Görsel çözünürlüğü (varsayılan matplotlib ayarı)
+
+    Returns:
+        dict: Kernel adı -> 'rendered' ya da 'cached'
+    """
+    if resolution is None:
+        resolution = Config.PLOT_RESOLUTION
+    if n_jobs is None:
+        n_jobs = Config.PLOT_WORKERS
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    cache_file = output_path / 'decision_boundary_cache.json'
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        cache = {}
+
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y)
+    data_hash = _array_digest(X, y)
+    keys = {name: f"{model_digest(model)}:{data_hash}:{resolution}:{max_points}:{dpi}"
+            for name, model in models.items()}
+    status = {name: 'cached' for name in models
+              if cache.get(name) == keys[name] and (output_path / f'decision_boundary_{name}.png').exists()}
+    pending = [name for name in models if name not in status]
+    if not pending:
+        return status
+
+    if len(X) > max_points:
+        sample = np.random.default_rng(42).choice(len(X), max_points, replace=False)
+        X_plot, y_plot = X[sample], y[sample]
+    else:
+        X_plot, y_plot = X, y
+
+    xx, yy, xy = decision_grid(X, resolution)
+    tasks = []
+    for name in pending:
+        model = models[name]
+        Z = model.decision_function(xy).reshape(resolution, resolution) if hasattr(model, 'decision_function') else None
+        tasks.append((name, X_plot, y_plot, xx, yy, Z, output_path / f'decision_boundary_{name}.png', dpi))
+
+    if n_jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks))) as executor:
+            rendered = list(executor.map(_render, tasks))
+    else:
+        rendered = [_render(task) for task in tasks]
+
+    for name in rendered:
+        cache[name] = keys[name]
+        status[name] = 'rendered'
+    tmp_path = cache_file.with_name(cache_file.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, indent=4)
+    os.replace(tmp_path, cache_file)
+    return status
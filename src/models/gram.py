@@ -0,0 +1,150 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+from src.config import Config
+
+
+def resolve_gamma(gamma, X):
+    """
+    SVC'nin gamma parametresini sayıya çevirir ('scale', 'auto' ya da sayı).
+
+    'scale' değeri X'in tamamının varyansıyla hesaplanır (sklearn ile aynı formül).
+    """
+    X = np.asarray(X, dtype=np.float64)
+    if gamma == 'scale':
+        variance = X.var()
+        return 1.0 / (X.shape[1] * variance) if variance != 0 else 1.0
+    if gamma == 'auto':
+        return 1.0 / X.shape[1]
+    return float(gamma)
+
+
+def kernel_matrix(A, B, kernel, gamma=1.0, degree=3, coef0=0.0):
+    """
+    A ve B satırları arasındaki kernel matrisini libsvm'in formülleriyle hesaplar.
+
+    Returns:
+        np.ndarray: (len(A), len(B)) boyutlu kernel değerleri
+    """
+    dot = np.asarray(A, dtype=np.float64) @ np.asarray(B, dtype=np.float64).T
+    if kernel == 'linear':
+        return dot
+    if kernel == 'poly':
+        return (gamma * dot + coef0) ** degree
+    if kernel == 'sigmoid':
+        return np.tanh(gamma * dot + coef0)
+    if kernel == 'rbf':
+        squared = (A ** 2).sum(axis=1)[:, np.newaxis] + (B ** 2).sum(axis=1)[np.newaxis, :] - 2 * dot
+        return np.exp(-gamma * np.maximum(squared, 0.0))
+    raise ValueError(f"Desteklenmeyen kernel: {kernel}")
+
+
+class GramCache:
+    """
+    Eğitim kümesinin kernel (Gram) matrislerini bir kez hesaplayıp paylaştırır.
+
+    Matrisler tekil özellik satırları üzerinden tutulur; tekrar eden satırların
+    kernel satırları aynı olduğu için bilgi kaybı yoktur ve `inverse` her eğitim
+    satırını matristeki satırına eşler. Her (kernel, gamma, degree, coef0) için
+    matris bir kez hesaplanır; C değerleri ve çapraz doğrulama katları bunun alt
+    bloklarını kernel='precomputed' ile kullanır. `memmap_rows` satırdan büyük
+    matrisler geçici bir dizinde .npy memmap olarak tutulur ve parça parça
+    doldurulur; joblib worker'ları aynı dosyayı kopyalamadan okur.
+
+    Gamma 'scale' tüm eğitim kümesiyle bir kez çözülür (katlarda da aynı değer).
+    """
+
+    def __init__(self, X, memmap_rows=None, directory=None, block_rows=2048):
+        X = np.asarray(X, dtype=np.float64)
+        self.X = X
+        self.rows, inverse = np.unique(X, axis=0, return_inverse=True)
+        self.inverse = inverse.ravel()
+        self.memmap_rows = Config.GRAM_MEMMAP_ROWS if memmap_rows is None else memmap_rows
+        self.directory = directory
+        self.block_rows = block_rows
+        self._tmpdir = None
+        self._matrices = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def kernel_params(self, kernel, params):
+        """Kernel'e etki eden parametreleri çözülmüş haliyle döndürür (C hariç)."""
+        if kernel == 'linear':
+            return {}
+        resolved = {'gamma': resolve_gamma(params.get('gamma', 'scale'), self.X)}
+        if kernel in ('poly', 'sigmoid'):
+            resolved['coef0'] = float(params.get('coef0', 0.0))
+        if kernel == 'poly':
+            resolved['degree'] = int(params.get('degree', 3))
+        return resolved
+
+    def matrix(self, kernel, params):
+        """
+        Tekil satırlar arasındaki kernel matrisi; aynı kernel parametreleri için önbellekten döner.
+
+        Returns:
+            np.ndarray: (tekil satır, tekil satır) boyutlu matris (büyükse np.memmap)
+        """
+        resolved = self.kernel_params(kernel, params)
+        key = (kernel, tuple(sorted(resolved.items())))
+        matrix = self._matrices.get(key)
+        if matrix is None:
+            matrix = self._matrices[key] = self._compute(kernel, resolved, len(self._matrices))
+        return matrix
+
+    def _compute(self, kernel, resolved, index):
+        n = len(self.rows)
+        if n > self.memmap_rows:
+            if self._tmpdir is None:
+                self._tmpdir = tempfile.mkdtemp(prefix='gram_', dir=self.directory)
+            path = os.path.join(self._tmpdir, f'{kernel}_{index}.npy')
+            matrix = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(n, n))
+        else:
+            matrix = np.empty((n, n), dtype=np.float64)
+        # Parça parça doldurulur; bellekte aynı anda en fazla block_rows x n değer tutulur
+        for start in range(0, n, self.block_rows):
+            stop = min(start + self.block_rows, n)
+            matrix[start:stop] = kernel_matrix(self.rows[start:stop], self.rows, kernel, **resolved)
+        if isinstance(matrix, np.memmap):
+            matrix.flush()
+        return matrix
+
+    def close(self):
+        """Önbelleği boşaltır ve diskteki memmap dosyalarını siler."""
+        self._matrices.clear()
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+
+def native_svc(model, support_vectors, kernel, params, resolved):
+    """
+    kernel='precomputed' ile eğitilmiş SVC'yi aynı çözümü kullanan olağan SVC'ye çevirir.
+
+    İkili katsayılar ve sabit terim aynen korunur; yalnızca destek vektörlerinin
+    özellikleri ve kernel parametreleri yerleştirilir. Böylece model paket,
+    kayıt defteri ve karar sınırı görselleri tarafından değişmeden kullanılır
+    ve çıkarım sırasında yalnızca destek vektörlerine karşı kernel hesaplanır.
+
+    Args:
+        model (SVC): Önceden hesaplanmış kernel ile eğitilmiş model
+        support_vectors (np.ndarray): model.support_ sırasıyla destek vektörlerinin özellikleri
+        kernel (str): Asıl kernel adı
+        params (dict): Izgara parametreleri (C, gamma, degree, ...)
+        resolved (dict): GramCache.kernel_params çıktısı
+
+    Returns:
+        SVC: Ham özelliklerle tahmin yapabilen model
+    """
+    support_vectors = np.ascontiguousarray(support_vectors, dtype=np.float64)
+    model.set_params(kernel=kernel, **dict(params, **resolved))
+    model.support_vectors_ = support_vectors
+    model.shape_fit_ = (model.shape_fit_[0], support_vectors.shape[1])
+    model.n_features_in_ = support_vectors.shape[1]
+    model._gamma = resolved.get('gamma', 0.0)
+    return model
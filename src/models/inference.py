@@ -0,0 +1,63 @@
+import time
+import numpy as np
+from src import metrics
+
+# Sunum yolunun ihtiyaç duyduğu tahmin fonksiyonları. Bu modül yalnızca numpy
+# kullanır; API açılırken pandas, sklearn ya da matplotlib yüklenmez.
+
+INFERENCE_STAGE_SECONDS = metrics.histogram(
+    'inference_stage_seconds', 'Model yolunda ölçekleme ve decision_function süreleri')
+
+
+def scale_features(scaler, X):
+    """
+    StandardScaler.transform ile aynı dönüşümü pandas ve girdi doğrulaması
+    olmadan uygular (DataFrame ile eğitilmiş scaler'da isim uyarısı da oluşmaz).
+
+    Args:
+        scaler (StandardScaler): Eğitilmiş scaler
+        X (array-like): (n, 2) boyutlu tecrube_yili, teknik_puan matrisi
+
+    Returns:
+        np.ndarray: Ölçeklenmiş matris
+    """
+    X_scaled = np.array(X, dtype=np.float64)
+    if scaler.with_mean:
+        X_scaled -= scaler.mean_
+    if scaler.with_std:
+        X_scaled /= scaler.scale_
+    return X_scaled
+
+
+def predict_candidates(model, scaler, X):
+    """
+    Adayları tek geçişte değerlendirir.
+
+    Ölçekleme ve karar fonksiyonu tüm matris üzerinde bir kez çalıştırılır;
+    etiket karar değerinin işaretinden, güven skoru mutlak değerinden türetilir.
+
+    Args:
+        X (array-like): (n, 2) boyutlu tecrube_yili, teknik_puan matrisi
+
+    Returns:
+        tuple: (tahminler, güven skorları) numpy dizileri
+    """
+    started = time.perf_counter()
+    X_scaled = scale_features(scaler, X)
+    scaled = time.perf_counter()
+    decision = model.decision_function(X_scaled)
+    INFERENCE_STAGE_SECONDS.observe(scaled - started, stage='transform')
+    INFERENCE_STAGE_SECONDS.observe(time.perf_counter() - scaled, stage='decision_function')
+    predictions = model.classes_[(decision > 0).astype(int)]
+    return predictions, np.abs(decision)
+
+
+def score_candidate(model, scaler, tecrube_yili, teknik_puan):
+    """
+    Tek aday için etiket ve güven skorunu tek decision_function çağrısıyla hesaplar.
+
+    Returns:
+        tuple: (tahmin, güven skoru)
+    """
+    predictions, confidences = predict_candidates(model, scaler, [[tecrube_yili, teknik_puan]])
+    return predictions[0], confidences[0]
@@ -0,0 +1,101 @@
+import os
+import json
+import numpy as np
+from pathlib import Path
+
+
+class LinearScorer:
+    """
+    Doğrusal model + StandardScaler ikilisinin kapalı form karşılığı.
+
+    Ölçekleme ağırlıklara katlanmıştır: ((x - mean) / scale)·w + b yerine
+    x·w' + b' hesaplanır. Çıkarım sırasında sklearn'ün girdi doğrulaması
+    ve dönüşüm adımları atlanır.
+    """
+
+    serving_path = 'closed_form'
+
+    def __init__(self, weights, bias, classes, kernel='linear', source_digest=None):
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        self.classes = np.asarray(classes)
+        self.kernel = kernel
+        self.source_digest = source_digest
+        # Tek aday yolu için düz Python sayıları
+        self._w0, self._w1 = (float(w) for w in self.weights)
+        self._negative, self._positive = (c.item() for c in self.classes)
+
+    @classmethod
+    def from_model(cls, model, scaler, kernel='linear', source_digest=None):
+        coef = np.asarray(model.coef_, dtype=np.float64).ravel()
+        intercept = float(np.asarray(model.intercept_).ravel()[0])
+        mean = scaler.mean_ if scaler.with_mean else np.zeros_like(coef)
+        scale = scaler.scale_ if scaler.with_std else np.ones_like(coef)
+        weights = coef / scale
+        bias = intercept - float(np.sum(coef * mean / scale))
+        return cls(weights, bias, model.classes_, kernel, source_digest)
+
+    def decision_function(self, X):
+        return np.asarray(X, dtype=np.float64) @ self.weights + self.bias
+
+    def predict_candidates(self, X):
+        decision = self.decision_function(X)
+        return self.classes[(decision > 0).astype(int)], np.abs(decision)
+
+    def score_candidate(self, tecrube_yili, teknik_puan):
+        decision = self._w0 * tecrube_yili + self._w1 * teknik_puan + self.bias
+        return (self._positive if decision > 0 else self._negative), abs(decision)
+
+    def save(self, path):
+        tmp_path = Path(str(path) + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'kernel': self.kernel,
+                'weights': self.weights.tolist(),
+                'bias': self.bias,
+                'classes': self.classes.tolist(),
+                'source_digest': self.source_digest
+            }, f, indent=4)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data['weights'], data['bias'], data['classes'], data['kernel'], data.get('source_digest'))
+
+
+def coefficient_path(model_path):
+    """best_model_<kernel>.joblib -> best_model_<kernel>.coef.json"""
+    return Path(model_path).with_suffix('.coef.json')
+
+
+def verify_linear_scorer(scorer, model, scaler, tol=1e-9):
+    """
+    Kapalı form skorlayıcıyı asıl modele karşı girdi uzayının tamamında doğrular.
+
+    libsvm doğrusal karar değerini destek vektörleri üzerinden topladığı için
+    sonuçlar bit düzeyinde değil, `tol` göreli/mutlak toleransıyla karşılaştırılır;
+    etiketler karar değeri tolerans dışında kalan her noktada birebir aynı olmalıdır.
+
+    Returns:
+        float: Gözlenen en büyük mutlak karar değeri farkı
+
+    Raises:
+        ValueError: Karar değerleri ya da etiketler uyuşmazsa
+    """
+    from src.models.inference import scale_features
+
+    tecrube, teknik = np.meshgrid(np.linspace(0, 10, 101), np.linspace(0, 100, 201))
+    X = np.column_stack([tecrube.ravel(), teknik.ravel()])
+
+    expected = model.decision_function(scale_features(scaler, X))
+    actual = scorer.decision_function(X)
+    if not np.allclose(actual, expected, rtol=tol, atol=tol):
+        raise ValueError("Kapalı form skorlayıcı karar değerleri modelle uyuşmuyor.")
+
+    decided = np.abs(expected) > tol
+    if not np.array_equal(scorer.predict_candidates(X[decided])[0], model.predict(scale_features(scaler, X[decided]))):
+        raise ValueError("Kapalı form skorlayıcı etiketleri modelle uyuşmuyor.")
+
+    return float(np.max(np.abs(actual - expected)))
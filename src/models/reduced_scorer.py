@@ -0,0 +1,151 @@
+import os
+import json
+import numpy as np
+from pathlib import Path
+from src.models.gram import kernel_matrix
+from src.models.inference import scale_features
+from src.models.decision_grid import TECRUBE_MAX, TEKNIK_MAX
+
+# Denenecek dayanak noktası sayıları (küçükten büyüğe; ilk yeterli olan seçilir)
+LANDMARK_SIZES = (4, 8, 16, 32, 64, 128)
+
+
+def _domain_points(tecrube_count, teknik_count):
+    # API'nin kabul ettiği girdi aralığını kapsayan düzenli ızgara (ham özellikler)
+    tecrube, teknik = np.meshgrid(np.linspace(0, TECRUBE_MAX, tecrube_count),
+                                  np.linspace(0, TEKNIK_MAX, teknik_count))
+    return np.column_stack([tecrube.ravel(), teknik.ravel()])
+
+
+class ReducedKernelScorer:
+    """
+    Doğrusal olmayan SVC'nin az sayıda dayanak noktasıyla (reduced set) yaklaşık karşılığı.
+
+    SVC'nin karar fonksiyonu destek vektörü sayısı kadar kernel değerinin
+    toplamıdır ve bu sayı eğitim verisiyle büyür. Burada destek vektörleri
+    |ikili katsayı| ağırlıklı k-means ile m merkeze indirilir. Merkezlerin
+    katsayıları, asıl karar fonksiyonunu girdi uzayının tamamında en küçük
+    kareler anlamında taklit edecek şekilde çözülür. Çıkarım, scaler dahil saf
+    numpy ile m kernel değeri hesaplar; sklearn yüklenmez.
+    """
+
+    serving_path = 'reduced'
+
+    def __init__(self, landmarks, coefficients, bias, classes, kernel, kernel_params, mean, scale,
+                 source_digest=None, report=None):
+        self.landmarks = np.asarray(landmarks, dtype=np.float64)
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        self.bias = float(bias)
+        self.classes = np.asarray(classes)
+        self.kernel = kernel
+        self.kernel_params = dict(kernel_params)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.source_digest = source_digest
+        # Sıkıştırma sırasında ölçülen değerler (dayanak sayısı, etiket uyumu, en büyük fark...)
+        self.report = report or {}
+
+    @classmethod
+    def from_model(cls, model, scaler, n_landmarks, source_digest=None, fit_points=None, random_state=0):
+        """
+        Eğitilmiş SVC'den n_landmarks dayanak noktalı skorlayıcı üretir.
+
+        Args:
+            model (SVC): rbf/poly/sigmoid kernel'li ikili SVC
+            scaler (StandardScaler): Modelle birlikte kaydedilen scaler
+            n_landmarks (int): Dayanak noktası sayısı
+            fit_points (np.ndarray): Katsayıların uydurulacağı ham noktalar
+                (varsayılan: girdi ızgarası + destek vektörleri)
+
+        Returns:
+            ReducedKernelScorer: Yaklaşık skorlayıcı
+        """
+        from sklearn.cluster import KMeans
+
+        # Aynı destek vektörü birden çok kez bulunabilir; ağırlıkları toplanır
+        support, inverse = np.unique(np.asarray(model.support_vectors_), axis=0, return_inverse=True)
+        weights = np.bincount(inverse.ravel(), weights=np.abs(np.asarray(model.dual_coef_)[0]))
+        landmarks = KMeans(n_clusters=min(n_landmarks, len(support)), n_init=3, random_state=random_state) \
+            .fit(support, sample_weight=weights).cluster_centers_
+
+        if fit_points is None:
+            fit_points = _domain_points(41, 41)
+        points = np.vstack([scale_features(scaler, fit_points), support])
+        kernel_params = {'gamma': float(model._gamma), 'degree': int(model.degree), 'coef0': float(model.coef0)}
+        features = kernel_matrix(points, landmarks, model.kernel, **kernel_params)
+        solution = np.linalg.lstsq(np.column_stack([features, np.ones(len(points))]),
+                                   model.decision_function(points), rcond=None)[0]
+
+        return cls(landmarks, solution[:-1], solution[-1], model.classes_, model.kernel, kernel_params,
+                   scaler.mean_, scaler.scale_, source_digest, {'landmarks': len(landmarks),
+                                                                'support_vectors': int(len(model.support_))})
+
+    def decision_function(self, X):
+        X_scaled = (np.asarray(X, dtype=np.float64) - self.mean) / self.scale
+        return kernel_matrix(X_scaled, self.landmarks, self.kernel, **self.kernel_params) @ self.coefficients + self.bias
+
+    def predict_candidates(self, X):
+        decision = self.decision_function(X)
+        return self.classes[(decision > 0).astype(int)], np.abs(decision)
+
+    def score_candidate(self, tecrube_yili, teknik_puan):
+        decision = float(self.decision_function([[tecrube_yili, teknik_puan]])[0])
+        return (self.classes[1] if decision > 0 else self.classes[0]).item(), abs(decision)
+
+    def save(self, path):
+        tmp_path = Path(str(path) + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'kernel': self.kernel,
+                'kernel_params': self.kernel_params,
+                'landmarks': self.landmarks.tolist(),
+                'coefficients': self.coefficients.tolist(),
+                'bias': self.bias,
+                'classes': self.classes.tolist(),
+                'mean': self.mean.tolist(),
+                'scale': self.scale.tolist(),
+                'source_digest': self.source_digest,
+                'report': self.report
+            }, f, indent=4)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data['landmarks'], data['coefficients'], data['bias'], data['classes'], data['kernel'],
+                   data['kernel_params'], data['mean'], data['scale'], data.get('source_digest'), data.get('report'))
+
+
+def reduced_path(model_path):
+    """best_model_<kernel>.joblib -> best_model_<kernel>.reduced.json"""
+    return Path(model_path).with_suffix('.reduced.json')
+
+
+def compress_model(model, scaler, min_agreement=0.9999, sizes=LANDMARK_SIZES, source_digest=None):
+    """
+    Asıl modelle girdi uzayında yeterince uyuşan en küçük skorlayıcıyı arar.
+
+    Her boyut için skorlayıcı, verify_linear_scorer ile aynı yoğun ızgarada
+    (101 x 201 nokta) asıl modelle karşılaştırılır. Karar değeri sıfır olmayan
+    noktalarda etiket uyumu min_agreement'e ulaşan ilk boyut seçilir. Destek
+    vektörü sayısından az dayanakla bu uyum sağlanamıyorsa sıkıştırmanın
+    anlamı yoktur ve None döner.
+
+    Returns:
+        ReducedKernelScorer | None: Seçilen skorlayıcı (ölçümler report içinde)
+    """
+    X = _domain_points(101, 201)
+    expected = model.decision_function(scale_features(scaler, X))
+    decided = expected != 0
+
+    for size in sizes:
+        if size >= len(model.support_):
+            break
+        scorer = ReducedKernelScorer.from_model(model, scaler, size, source_digest)
+        actual = scorer.decision_function(X)
+        agreement = float(np.mean((actual[decided] > 0) == (expected[decided] > 0)))
+        if agreement >= min_agreement:
+            scorer.report.update(agreement=agreement, max_error=float(np.max(np.abs(actual - expected))))
+            return scorer
+    return None
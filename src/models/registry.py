@@ -0,0 +1,184 @@
+import os
+import json
+import time
+import shutil
+from pathlib import Path
+from functools import lru_cache
+from src.config import Config
+from src.models.bundle import file_digest, load_bundle
+from src.models.linear_scorer import LinearScorer, coefficient_path
+from src.models.reduced_scorer import ReducedKernelScorer, reduced_path
+
+# Etkin modelin geçmişinde tutulacak en fazla kayıt (geri alma için)
+MAX_HISTORY = 20
+
+
+def registry_dir():
+    return Config.PROJECT_ROOT / 'data/registry'
+
+
+def active_model_file():
+    """Etkin modeli gösteren işaretçi dosyası (tüm API worker'ları bu dosyayı izler)."""
+    return Config.PROJECT_ROOT / 'data/active_model.json'
+
+
+def artifact_path(model_hash):
+    return registry_dir() / 'artifacts' / f'{model_hash}.joblib'
+
+
+def _write_json(path, data):
+    # Geçici dosyaya yazıp yerine taşı: okuyucular yarım yazılmış dosya görmez
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+def _copy_atomic(source, target):
+    if target.exists():
+        return
+    tmp_path = target.with_name(target.name + '.tmp')
+    shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, target)
+
+
+def read_manifest():
+    try:
+        with open(registry_dir() / 'manifest.json') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'models': {}}
+
+
+def register_model(model_path, kernel, metrics=None, data_path=None, timings=None):
+    """
+    Model dosyasını içerik özetiyle adreslenen bir artefakt olarak kayıt defterine ekler.
+
+    Aynı içerik ikinci kez kaydedilirse yeni kopya oluşmaz. Model için geçerli
+    bir katsayı dosyası (.coef.json) ya da sıkıştırılmış skorlayıcı (.reduced.json)
+    varsa o da artefaktın yanına kopyalanır.
+
+    Args:
+        model_path (str | Path): save_best_model_as_pickle'ın yazdığı dosya
+        kernel (str): Model türü
+        metrics (dict): Değerlendirme metrikleri
+        data_path (str | Path): Eğitim verisi (özeti manifeste yazılır)
+        timings (dict): Aşama süreleri (saniye)
+
+    Returns:
+        dict: Manifest kaydı
+    """
+    model_path = Path(model_path)
+    model_hash = file_digest(model_path)
+    target = artifact_path(model_hash)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    _copy_atomic(model_path, target)
+
+    source_coef = coefficient_path(model_path)
+    if source_coef.exists() and LinearScorer.load(source_coef).source_digest == model_hash:
+        _copy_atomic(source_coef, coefficient_path(target))
+    source_reduced = reduced_path(model_path)
+    if source_reduced.exists() and ReducedKernelScorer.load(source_reduced).source_digest == model_hash:
+        _copy_atomic(source_reduced, reduced_path(target))
+
+    manifest = read_manifest()
+    entry = manifest['models'].get(model_hash) or {
+        'hash': model_hash,
+        'kernel': kernel,
+        'artifact': str(target.relative_to(Config.PROJECT_ROOT)),
+        'created_at': time.time(),
+    }
+    entry.update({
+        'metrics': metrics or entry.get('metrics'),
+        'data_hash': file_digest(data_path) if data_path else entry.get('data_hash'),
+        'timings': timings or entry.get('timings'),
+    })
+    manifest['models'][model_hash] = entry
+    _write_json(registry_dir() / 'manifest.json', manifest)
+    return entry
+
+
+def resolve(model_hash):
+    """Tam ya da tekil bir önek olarak verilen özeti manifestteki tam özete çevirir."""
+    matches = [h for h in read_manifest()['models'] if h.startswith(model_hash)]
+    if len(matches) != 1:
+        raise KeyError(model_hash)
+    return matches[0]
+
+
+def read_active_model():
+    """
+    Etkin model işaretçisini okur.
+
+    Returns:
+        tuple: (işaretçi bilgisi, dosyanın mtime_ns değeri); dosya yoksa (None, None)
+    """
+    pointer = active_model_file()
+    try:
+        mtime = pointer.stat().st_mtime_ns
+        with open(pointer) as f:
+            return json.load(f), mtime
+    except FileNotFoundError:
+        return None, None
+
+
+def _write_pointer(model_hash, history):
+    _write_json(active_model_file(), {
+        'hash': model_hash,
+        'version': model_hash[:12],
+        'path': str(artifact_path(model_hash)),
+        'activated_at': time.time(),
+        'history': history[-MAX_HISTORY:]
+    })
+
+
+def activate(model_hash):
+    """
+    Kayıtlı bir modeli etkinleştirir. Yalnızca işaretçi dosyası atomik olarak
+    değiştirilir; yeniden eğitim yapılmaz. Önceki etkin model geçmişe eklenir.
+
+    Raises:
+        KeyError: Özet kayıt defterinde yoksa
+    """
+    model_hash = resolve(model_hash)
+    if not artifact_path(model_hash).exists():
+        raise KeyError(model_hash)
+
+    active, _ = read_active_model()
+    history = list(active.get('history', [])) if active else []
+    if active and active.get('hash') and active['hash'] != model_hash:
+        history.append(active['hash'])
+    _write_pointer(model_hash, history)
+    return model_hash
+
+
+def previous_model():
+    """
+    Geri alma ile dönülecek modelin özetini döndürür.
+
+    Raises:
+        LookupError: Geri dönülecek model yoksa
+    """
+    active, _ = read_active_model()
+    history = active.get('history', []) if active else []
+    if not history:
+        raise LookupError("Geri dönülecek önceki model yok.")
+    return history[-1]
+
+
+def rollback():
+    """Bir önceki etkin modele döner; dönülen modelin özetini döndürür."""
+    previous = previous_model()
+    active, _ = read_active_model()
+    _write_pointer(previous, active['history'][:-1])
+    return previous
+
+
+@lru_cache(maxsize=8)
+def load_model(model_hash):
+    """
+    Artefaktı özetine göre yükler. İçerik değişmez olduğu için yüklenen paket
+    süreç içinde önbelleğe alınır; aynı modele geri dönmek yeniden yükleme gerektirmez.
+    """
+    return load_bundle(artifact_path(model_hash))
@@ -1,20 +1,40 @@
+import os
 import json
+import time
 import joblib
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from contextlib import nullcontext
 from sklearn.svm import SVC
 from src.config import Config
-import matplotlib.pyplot as plt
+from src import metrics
+from sklearn.linear_model import SGDClassifier
+from src.data.feature_store import read_columns, iter_columns, FEATURE_COLUMNS, LABEL_COLUMN
+from src.models.linear_scorer import LinearScorer, coefficient_path, verify_linear_scorer
+from src.models.reduced_scorer import compress_model, reduced_path
+from src.models.inference import scale_features, predict_candidates, score_candidate
+from src.models.registry import register_model, activate
+from src.models.gram import GramCache, resolve_gamma, native_svc
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
 
 
+TRAINING_STAGE_SECONDS = metrics.histogram(
+    'training_stage_seconds', 'Eğitim hattı aşama süreleri', metrics.STAGE_BUCKETS)
+FIT_SECONDS = metrics.histogram(
+    'training_fit_seconds', "Kernel başına model eğitim süresi", metrics.STAGE_BUCKETS)
+EVALUATION_SECONDS = metrics.histogram(
+    'evaluation_predict_seconds', "Kernel başına test kümesi karar değerleri süresi", metrics.STAGE_BUCKETS)
+MODEL_SAVE_SECONDS = metrics.histogram(
+    'model_save_seconds', 'En iyi modelin joblib ile kaydedilme süresi', metrics.STAGE_BUCKETS)
+
 def load_and_preprocess_data(filename='candidate_data.csv'):
-    data = pd.read_csv(Config.PROJECT_ROOT / f'data/{filename}')
-    X = data[['tecrube_yili', 'teknik_puan']]
-    y = data['etiket']
+    # Yalnızca model sütunları okunur: .csv, .parquet ya da özellik deposu (ör. 'features')
+    data = read_columns(filename, FEATURE_COLUMNS + [LABEL_COLUMN])
+    X = data[FEATURE_COLUMNS]
+    y = data[LABEL_COLUMN]
 
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=42
@@ -26,32 +46,432 @@ def load_and_preprocess_data(filename='candidate_data.csv'):
 
     return X_train_scaled, X_test_scaled, y_train, y_test, scaler
 
-def train_svm_models(X_train, y_train, kernels=None):
+def compress_duplicates(X, y):
+    """
+    Aynı (özellikler, etiket) satırlarını tek satıra indirir.
+
+    Özellikler tam sayı değerli olduğu için büyük veride satırların çoğu
+    tekrardır. Tekrar sayıları SVC.fit'e sample_weight olarak verilir; libsvm
+    ağırlığı satırın C değerine çarpan olarak uyguladığı için çözüm, tüm
+    satırlarla eğitilen modelle aynıdır (gamma='scale' tüm veriyle
+    hesaplanmak şartıyla, bkz. resolve_gamma). Bu eşdeğerlik yalnızca pozitif
+    yarı tanımlı kernel'ler için geçerlidir; sigmoid sıkıştırılmaz (bkz.
+    DEDUPLICATE_KERNELS).
+
+    Args:
+        X (np.ndarray): Özellik matrisi
+        y: Etiketler
+
+    Returns:
+        tuple: (tekil X, tekil y, tekrar sayıları)
+    """
+    y = np.asarray(y)
+    rows = np.column_stack([np.asarray(X, dtype=np.float64), y])
+    unique, counts = np.unique(rows, axis=0, return_counts=True)
+    return unique[:, :-1], unique[:, -1].astype(y.dtype), counts.astype(np.float64)
+
+# Tekrar sıkıştırmasının tüm satırlarla eğitimle aynı çözümü verdiği kernel'ler.
+# sigmoid pozitif yarı tanımlı olmadığı için libsvm farklı bir çözüme yakınsayabilir.
+DEDUPLICATE_KERNELS = ('linear', 'rbf', 'poly')
+
+def _pin_gamma(model, X):
+    # gamma='scale' tekil satırların değil tüm verinin varyansıyla çözülür;
+    # linear kernel gamma kullanmadığı için parametreleri değiştirilmez
+    if model.kernel in ('rbf', 'poly', 'sigmoid'):
+        model.set_params(gamma=resolve_gamma(model.gamma, X))
+    return model
+
+def train_svm_models(X_train, y_train, kernels=None, deduplicate=None):
     if kernels is None:
         kernels = ['linear', 'rbf', 'poly', 'sigmoid']
+    if deduplicate is None:
+        deduplicate = Config.TRAIN_DEDUPLICATE
+
+    # SVC'ler için tekrarlar bir kez sıkıştırılır; SGD adım sayısı satır sayısına bağlı olduğu için tüm veriyi görür
+    compressed = None
+    if deduplicate and any(kernel in DEDUPLICATE_KERNELS for kernel in kernels):
+        compressed = compress_duplicates(X_train, y_train)
 
     models = {}
     for kernel in kernels:
-        model = SVC(kernel=kernel)
-        model.fit(X_train, y_train)
+        # 'sgd': hinge kayıplı doğrusal SVM, SGD ile (büyük veri için)
+        model = SGDClassifier(loss='hinge', random_state=42) if kernel == 'sgd' else SVC(kernel=kernel)
+        with FIT_SECONDS.time(kernel=kernel):
+            if kernel in DEDUPLICATE_KERNELS and compressed is not None:
+                X_unique, y_unique, counts = compressed
+                _pin_gamma(model, X_train).fit(X_unique, y_unique, sample_weight=counts)
+            else:
+                model.fit(X_train, y_train)
         models[kernel] = model
 
     return models
 
-def evaluate_and_save_models(models, X_test, y_test, output_dir):
+# search_svm_models için varsayılan hiperparametre ızgarası
+DEFAULT_PARAM_GRID = {
+    'linear': {'C': [0.1, 1, 10]},
+    'rbf': {'C': [0.1, 1, 10], 'gamma': ['scale', 0.1, 1]},
+    'poly': {'C': [0.1, 1, 10], 'degree': [2, 3], 'gamma': ['scale']},
+    'sigmoid': {'C': [0.1, 1, 10], 'gamma': ['scale', 0.1]},
+}
+
+def _fit_and_score_fold(kernel, params, X, y, train_idx, test_idx, deduplicate=False):
+    model = _fit_svc(kernel, params, X[train_idx], y[train_idx], deduplicate)
+    return accuracy_score(y[test_idx], model.predict(X[test_idx]))
+
+def _fit_svc(kernel, params, X, y, deduplicate=False):
+    model = SVC(kernel=kernel, **params)
+    if not deduplicate or kernel not in DEDUPLICATE_KERNELS:
+        return model.fit(X, y)
+    _pin_gamma(model, X)
+    X_unique, y_unique, counts = compress_duplicates(X, y)
+    return model.fit(X_unique, y_unique, sample_weight=counts)
+
+def _gram_training_set(inverse, y, index):
+    # Eğitim satırlarını Gram matrisindeki tekil satır numaralarına çevirir; aynı
+    # (satır, etiket) çiftleri her zaman ağırlıklı tek satır olur. Böylece fit'e
+    # verilen blok en fazla (tekil satır x tekil satır) boyutundadır.
+    unique, labels, counts = compress_duplicates(inverse[index][:, np.newaxis], y[index])
+    return unique[:, 0].astype(np.intp), labels, counts
+
+def _fit_and_score_gram_fold(K, inverse, y, C, train_idx, test_idx):
+    rows, labels, weights = _gram_training_set(inverse, y, train_idx)
+    model = SVC(kernel='precomputed', C=C).fit(K[np.ix_(rows, rows)], labels, sample_weight=weights)
+    # Doğrulama katı, önbellekteki çapraz kernel bloğuyla skorlanır
+    return accuracy_score(y[test_idx], model.predict(K[np.ix_(inverse[test_idx], rows)]))
+
+def _fit_svc_gram(K, gram_rows, inverse, y, kernel, params, resolved):
+    rows, labels, weights = _gram_training_set(inverse, y, np.arange(len(y)))
+    model = SVC(kernel='precomputed', C=params.get('C', 1.0))
+    model.fit(K[np.ix_(rows, rows)], labels, sample_weight=weights)
+    return native_svc(model, gram_rows[rows[model.support_]], kernel, params, resolved)
+
+def search_svm_models(X_train, y_train, kernels=None, param_grid=None, cv=5, n_jobs=-1, cutoff=0.05,
+                      gram_cache=None, deduplicate=None):
+    """
+    Kernel ve C/gamma/degree ızgarasını çapraz doğrulama ile paralel tarar.
+
+    Arama iki aşamada yapılır: önce her konfigürasyon yalnızca ilk katta
+    değerlendirilir; ilk kat skoru en iyiden `cutoff` kadar düşük kalan umutsuz
+    konfigürasyonlar elenir, kalanlar diğer katlarda değerlendirilir. Her kernel
+    için en iyi konfigürasyon tüm eğitim verisiyle yeniden eğitilir.
+
+    `gram_cache` açıkken her kernel parametre kümesinin Gram matrisi bir kez
+    hesaplanır (GramCache); tüm C değerleri, katlar ve son eğitim bu matrisin
+    bloklarını kernel='precomputed' ile kullanır. Bu yol tekrarları her zaman
+    ağırlıklı tek satıra indirir (deduplicate'ten bağımsız); aksi halde her fit
+    (eğitim satırı x eğitim satırı) boyutunda yoğun bir blok kopyalardı.
+    Sıkıştırmanın eşdeğer olmadığı sigmoid fit başına kernel yolunda kalır. Son
+    modeller olağan SVC'ye çevrilerek döndürülür.
+
+    Args:
+        kernels (list): Taranacak kernel'ler (varsayılan: ızgaradaki tümü)
+        param_grid (dict): kernel -> {parametre: değerler} ızgarası
+        cv (int): Çapraz doğrulama kat sayısı
+        n_jobs (int): joblib paralel iş sayısı (-1: tüm çekirdekler)
+        cutoff (float): İlk katta en iyiden izin verilen doğruluk farkı
+        gram_cache (bool): Gram matrisi önbelleği kullanılsın mı (varsayılan Config.TRAIN_GRAM_CACHE)
+        deduplicate (bool): Tekrarlar ağırlıklı tek satıra indirilsin mi (varsayılan Config.TRAIN_DEDUPLICATE)
+
+    Returns:
+        tuple: (kernel -> model sözlüğü, konfigürasyon bazlı sonuç listesi)
+    """
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import ParameterGrid, StratifiedKFold
+
+    if param_grid is None:
+        param_grid = DEFAULT_PARAM_GRID
+    if kernels is None:
+        kernels = list(param_grid)
+    if gram_cache is None:
+        gram_cache = Config.TRAIN_GRAM_CACHE
+    if deduplicate is None:
+        deduplicate = Config.TRAIN_DEDUPLICATE
+
+    X = np.asarray(X_train)
+    y = np.asarray(y_train)
+    configs = [(kernel, params) for kernel in kernels for params in ParameterGrid(param_grid[kernel])]
+    folds = list(StratifiedKFold(n_splits=cv, shuffle=True, random_state=42).split(X, y))
+
+    with (GramCache(X) if gram_cache else nullcontext()) as gram, Parallel(n_jobs=n_jobs) as parallel:
+        def fold_task(i, fold):
+            kernel, params = configs[i]
+            if gram is None or kernel not in DEDUPLICATE_KERNELS:
+                return delayed(_fit_and_score_fold)(kernel, params, X, y, *fold, deduplicate)
+            # Aynı kernel parametreli konfigürasyonlar (farklı C) aynı matrisi paylaşır
+            return delayed(_fit_and_score_gram_fold)(
+                gram.matrix(kernel, params), gram.inverse, y, params.get('C', 1.0), *fold
+            )
+
+        def final_task(kernel, params):
+            if gram is None or kernel not in DEDUPLICATE_KERNELS:
+                return delayed(_fit_svc)(kernel, params, X, y, deduplicate)
+            return delayed(_fit_svc_gram)(
+                gram.matrix(kernel, params), gram.rows, gram.inverse, y,
+                kernel, params, gram.kernel_params(kernel, params)
+            )
+
+        first_scores = parallel(fold_task(i, folds[0]) for i in range(len(configs)))
+        threshold = max(first_scores) - cutoff
+        survivors = [i for i, score in enumerate(first_scores) if score >= threshold]
+
+        jobs = [(i, fold) for i in survivors for fold in folds[1:]]
+        rest_scores = parallel(fold_task(i, fold) for i, fold in jobs)
+
+        fold_scores = {i: [first_scores[i]] for i in range(len(configs))}
+        for (i, _), score in zip(jobs, rest_scores):
+            fold_scores[i].append(score)
+
+        results = []
+        for i, (kernel, params) in enumerate(configs):
+            results.append({
+                'kernel': kernel,
+                'params': params,
+                'fold_scores': fold_scores[i],
+                'mean_score': float(np.mean(fold_scores[i])),
+                'pruned': i not in survivors
+            })
+
+        # Her kernel için en iyi (elenmemiş) konfigürasyon; hepsi elendiyse ilk kat skoru
+        best = {}
+        for result in results:
+            current = best.get(result['kernel'])
+            key = (not result['pruned'], result['mean_score'])
+            if current is None or key > (not current['pruned'], current['mean_score']):
+                best[result['kernel']] = result
+
+        fitted = parallel(final_task(kernel, best[kernel]['params']) for kernel in best)
+
+    return dict(zip(best, fitted)), results
+
+def _is_test_row(row_index, test_every):
+    # Satır sırasına göre deterministik ayrım: her test_every'inci satır teste ayrılır
+    return row_index % test_every == 0
+
+def train_incremental_model(filename='candidate_data.csv', chunksize=100_000, epochs=1,
+                            test_every=5, max_test_rows=200_000, random_state=42):
+    """
+    Belleğe sığmayan veri için bellek dışı (out-of-core) eğitim yapar.
+
+    Dosya parça parça okunur: ilk geçişte StandardScaler partial_fit ile, sonraki
+    geçişlerde hinge kayıplı SGDClassifier (doğrusal SVM) partial_fit ile mini
+    batch'ler halinde eğitilir. Her `test_every`'inci satır test için ayrılır;
+    bellekte yalnızca bir parça ve en fazla `max_test_rows` test satırı tutulur.
+
+    Args:
+        filename (str): data/ altındaki .csv, .parquet dosyası ya da özellik deposu adı
+        chunksize (int): Parça başına satır sayısı
+        epochs (int): Veri üzerinden geçiş sayısı
+        test_every (int): Test için ayrılacak satır aralığı
+        max_test_rows (int): Bellekte tutulacak en fazla test satırı
+        random_state (int): Parça içi karıştırma ve SGD tohumu
+
+    Returns:
+        tuple: ({'sgd': model}, X_test_scaled, y_test, scaler)
+    """
+    columns = FEATURE_COLUMNS + [LABEL_COLUMN]
+
+    def train_chunks():
+        offset = 0
+        for chunk in iter_columns(filename, columns, chunksize):
+            is_test = _is_test_row(np.arange(offset, offset + len(chunk)), test_every)
+            offset += len(chunk)
+            yield chunk[~is_test], chunk[is_test]
+
+    # 1. geçiş: ölçekleme istatistikleri ve test kümesi
+    scaler = StandardScaler()
+    X_test, y_test, n_test = [], [], 0
+    for train_part, test_part in train_chunks():
+        if len(train_part):
+            scaler.partial_fit(train_part[FEATURE_COLUMNS].to_numpy(dtype=np.float64))
+        if n_test < max_test_rows:
+            test_part = test_part.iloc[:max_test_rows - n_test]
+            X_test.append(test_part[FEATURE_COLUMNS].to_numpy(dtype=np.float64))
+            y_test.append(test_part[LABEL_COLUMN].to_numpy())
+            n_test += len(test_part)
+
+    # 2. geçiş ve sonrası: mini batch eğitim
+    rng = np.random.default_rng(random_state)
+    model = SGDClassifier(loss='hinge', random_state=random_state)
+    classes = np.array([0, 1])
+    for _ in range(epochs):
+        for train_part, _ in train_chunks():
+            if not len(train_part):
+                continue
+            order = rng.permutation(len(train_part))
+            X = scale_features(scaler, train_part[FEATURE_COLUMNS].to_numpy(dtype=np.float64)[order])
+            y = train_part[LABEL_COLUMN].to_numpy()[order]
+            model.partial_fit(X, y, classes=classes)
+
+    X_test = scale_features(scaler, np.concatenate(X_test))
+    return {'sgd': model}, X_test, np.concatenate(y_test), scaler
+
+def _support_vector_set(model, scaler):
+    """
+    SVC modelinin destek vektörlerini ham özellik uzayında (X, y, ağırlık) olarak döndürür.
+
+    İkili SVC'de dual_coef_ işareti destek vektörünün sınıfını verir
+    (pozitif: classes_[1]). Yalnızca destek vektörleriyle yeniden eğitim
+    aynı çözümü verdiği için önceki veri bu küçük kümeyle temsil edilir.
+    Tekrarları sıkıştırılarak eğitilen modellerde bir destek vektörünün
+    katsayısı C * ağırlık değerine ulaşabilir; ağırlık ceil(|katsayı| / C)
+    ile geri kazanılır (sıkıştırmasız modellerde hep 1).
+    """
+    dual_coef = np.asarray(model.dual_coef_)[0]
+    X = np.asarray(model.support_vectors_) * scaler.scale_ + scaler.mean_
+    y = model.classes_[(dual_coef > 0).astype(int)]
+    weights = np.maximum(1.0, np.ceil(np.abs(dual_coef) / model.C - 1e-8))
+    return X, y, weights
+
+def _rescale_coefficients(model, old_scaler, new_scaler):
+    # Doğrusal katsayıları eski ölçekten ham uzaya, oradan yeni ölçeğe taşır;
+    # karar fonksiyonu ölçek güncellemesinden etkilenmez
+    weights = model.coef_[0] / old_scaler.scale_
+    bias = model.intercept_[0] - weights @ old_scaler.mean_
+    model.coef_ = (weights * new_scaler.scale_)[np.newaxis, :]
+    model.intercept_ = np.array([bias + weights @ new_scaler.mean_])
+
+def _check_support_vector_refit(estimator, model, scaler, X_sv, y_sv, w_sv, min_agreement=0.999, margin=0.05):
+    """
+    Yalnızca destek vektörleriyle yeniden eğitimin önceki modeli ürettiğini doğrular.
+
+    Artımlı güncelleme önceki verinin destek vektörleriyle temsil edilebildiği
+    varsayımına dayanır. Karşılaştırma destek vektörlerinde ve girdi aralığını
+    kapsayan bir ızgarada, önceki scaler ile yapılır. Önceki modelin karar
+    değeri margin'den küçük olan noktalar sayılmaz: libsvm'in durma toleransı
+    karar değerlerini bu mertebede oynatır ve sınırın üzerindeki ızgara
+    noktalarının etiketi yalnızca bu yüzden değişebilir.
+
+    Raises:
+        ValueError: Etiket uyumu min_agreement'in altında kalırsa
+    """
+    from sklearn.base import clone
+    from src.models.decision_grid import TECRUBE_MAX, TEKNIK_MAX
+
+    tecrube, teknik = np.meshgrid(np.linspace(0, TECRUBE_MAX, 41), np.linspace(0, TEKNIK_MAX, 41))
+    probe = scale_features(scaler, np.vstack([X_sv, np.column_stack([tecrube.ravel(), teknik.ravel()])]))
+    refit = clone(estimator).fit(scale_features(scaler, X_sv), y_sv, sample_weight=w_sv)
+    expected = model.decision_function(probe)
+    decided = np.abs(expected) >= margin
+    if not decided.any():
+        return
+    agreement = float(np.mean((refit.decision_function(probe[decided]) > 0) == (expected[decided] > 0)))
+    if agreement < min_agreement:
+        raise ValueError(f"Destek vektörleriyle yeniden eğitim önceki modeli üretmiyor (etiket uyumu {agreement:.4f}).")
+
+def incremental_update(model, scaler, X_new, y_new):
+    """
+    Önceki modeli yalnızca yeni kayıtlarla günceller.
+
+    Scaler istatistikleri partial_fit ile güncellenir. SGD modelleri katsayıları
+    yeni ölçeğe taşındıktan sonra partial_fit ile devam eder; SVC modelleri
+    önceki destek vektörleri ve yeni kayıtlar üzerinde aynı parametrelerle
+    yeniden eğitilir. Maliyet tüm geçmişe değil, yeni veri ve destek vektörü
+    sayısına bağlıdır.
+
+    Args:
+        model: Önceki model (SVC ya da SGDClassifier)
+        scaler (StandardScaler): Önceki modelin scaler'ı
+        X_new (np.ndarray): Yeni kayıtların ham özellikleri
+        y_new (np.ndarray): Yeni kayıtların etiketleri
+
+    Returns:
+        tuple: (güncellenmiş model, güncellenmiş scaler); girdiler değiştirilmez
+
+    Raises:
+        ValueError: SVC destek vektörlerinden yeniden üretilemiyorsa (bkz. _check_support_vector_refit)
+    """
+    from copy import deepcopy
+    from sklearn.base import clone
+
+    new_scaler = deepcopy(scaler)
+    # Scaler DataFrame ile eğitildiyse (load_and_preprocess_data) aynı sütun adlarıyla güncellenir
+    if hasattr(scaler, 'feature_names_in_'):
+        new_scaler.partial_fit(pd.DataFrame(X_new, columns=scaler.feature_names_in_))
+    else:
+        new_scaler.partial_fit(X_new)
+
+    if isinstance(model, SGDClassifier):
+        model = deepcopy(model)
+        _rescale_coefficients(model, scaler, new_scaler)
+        model.partial_fit(scale_features(new_scaler, X_new), y_new)
+        return model, new_scaler
+
+    X_sv, y_sv, w_sv = _support_vector_set(model, scaler)
+    estimator = clone(model)
+    if model.kernel in ('rbf', 'poly', 'sigmoid'):
+        # gamma='scale' küçük kümede yeniden çözülürse kernel genişliği değişir; modelin değeri sabitlenir
+        estimator.set_params(gamma=float(model._gamma))
+    _check_support_vector_refit(estimator, model, scaler, X_sv, y_sv, w_sv)
+
+    X = np.vstack([X_sv, X_new])
+    y = np.concatenate([y_sv, y_new])
+    weights = np.concatenate([w_sv, np.ones(len(y_new))])
+    return estimator.fit(scale_features(new_scaler, X), y, sample_weight=weights), new_scaler
+
+def evaluate_models(models, X_test, y_test):
+    """
+    Her modelin test kümesindeki karar değerlerini tek geçişte hesaplar.
+
+    Tahminler karar değerinin işaretinden türetilir (ikili sınıflandırma),
+    böylece rapor, en iyi model seçimi ve API yanıtı modeli yeniden çalıştırmadan
+    aynı sonuçları kullanır.
+
+    Args:
+        models (dict): Kernel adı -> eğitilmiş model
+        X_test (np.ndarray): Ölçeklendirilmiş test özellikleri
+        y_test: Test etiketleri
+
+    Returns:
+        dict: Kernel adı -> {'y_pred', 'decision', 'accuracy', 'roc_auc', 'predict_seconds'}
+    """
+    from sklearn.metrics import roc_auc_score
+
+    y_test = np.asarray(y_test)
+    evaluations = {}
+    for name, model in models.items():
+        started = time.perf_counter()
+        decision = model.decision_function(X_test)
+        predict_seconds = time.perf_counter() - started
+        EVALUATION_SECONDS.observe(predict_seconds, kernel=name)
+        y_pred = model.classes_[(decision > 0).astype(int)]
+        evaluations[name] = {
+            'y_pred': y_pred,
+            'decision': decision,
+            'accuracy': accuracy_score(y_test, y_pred),
+            'roc_auc': roc_auc_score(y_test, decision) if len(np.unique(y_test)) == 2 else None,
+            'predict_seconds': predict_seconds
+        }
+    return evaluations
+
+def summarize_evaluations(evaluations, n_rows):
+    """Değerlendirme sonuçlarını JSON'a uygun kernel özetine çevirir (satır başına gecikme µs)."""
+    return {
+        name: {
+            'accuracy': float(e['accuracy']),
+            'roc_auc': None if e['roc_auc'] is None else float(e['roc_auc']),
+            'predict_us_per_row': e['predict_seconds'] / max(n_rows, 1) * 1e6
+        }
+        for name, e in evaluations.items()
+    }
+
+def evaluate_and_save_models(models, X_test, y_test, output_dir, evaluations=None):
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
+    if evaluations is None:
+        evaluations = evaluate_models(models, X_test, y_test)
 
     summary = []
-    for name, model in models.items():
-        y_pred = model.predict(X_test)
-        acc = accuracy_score(y_test, y_pred)
+    for name in models:
+        evaluation = evaluations[name]
+        y_pred = evaluation['y_pred']
         cm = confusion_matrix(y_test, y_pred).tolist()
         report = classification_report(y_test, y_pred, output_dict=True)
 
         result = {
             'kernel': name,
-            'accuracy': acc,
+            'accuracy': evaluation['accuracy'],
+            'roc_auc': evaluation['roc_auc'],
+            'predict_seconds': evaluation['predict_seconds'],
             'confusion_matrix': cm,
             'classification_report': report
         }
@@ -63,42 +483,23 @@ def evaluate_and_save_models(models, X_test, y_test, output_dir):
 
     pd.DataFrame(summary).to_csv(output_path / 'all_results.csv', index=False)
     print(f"Tüm çıktılar '{output_path}' klasörüne kaydedildi.")
+    return evaluations
 
 def plot_decision_boundary(model, X, y, scaler, kernel_name, output_dir):
-    plt.figure(figsize=(10, 6))
-    plt.scatter(X[:, 0], X[:, 1], c=y, cmap='coolwarm', alpha=0.6)
+    # Tek model için geriye dönük uyumlu sarmalayıcı; çoklu çizim için render_decision_boundaries
+    from src.models.decision_plots import render_decision_boundaries
 
-    ax = plt.gca()
-    xlim = ax.get_xlim()
-    ylim = ax.get_ylim()
+    render_decision_boundaries({kernel_name: model}, X, y, output_dir, n_jobs=1)
 
-    xx = np.linspace(xlim[0], xlim[1], 100)
-    yy = np.linspace(ylim[0], ylim[1], 100)
-    YY, XX = np.meshgrid(yy, xx)
-    xy = np.vstack([XX.ravel(), YY.ravel()]).T
-
-    try:
-        Z = model.decision_function(xy).reshape(XX.shape)
-        ax.contour(XX, YY, Z, colors='k', levels=[-1, 0, 1],
-                   alpha=0.5, linestyles=['--', '-', '--'])
-    except:
-        pass
-
-    plt.xlabel('Tecrübe Yılı (Ölçeklendirilmiş)')
-    plt.ylabel('Teknik Puan (Ölçeklendirilmiş)')
-    plt.title(f'SVM Karar Sınırı - {kernel_name}')
-    plot_path = Path(output_dir) / f'decision_boundary_{kernel_name}.png'
-    plt.savefig(plot_path)
-    plt.close()
-
-def save_best_model_as_pickle(models, X_test, y_test, scaler, output_dir):
+def save_best_model_as_pickle(models, X_test, y_test, scaler, output_dir, evaluations=None):
     best_acc = -1
     best_model = None
     best_name = ''
+    if evaluations is None:
+        evaluations = evaluate_models(models, X_test, y_test)
 
     for name, model in models.items():
-        y_pred = model.predict(X_test)
-        acc = accuracy_score(y_test, y_pred)
+        acc = evaluations[name]['accuracy']
 
         if acc > best_acc:
             best_acc = acc
@@ -108,9 +509,82 @@ def save_best_model_as_pickle(models, X_test, y_test, scaler, output_dir):
     if best_model:
         pkl_path = Path(output_dir) / f'best_model_{best_name}.joblib'
         # joblib.dump(best_model, pkl_path)
-        joblib.dump((best_model, scaler), pkl_path)
+        # Geçici dosyaya yazıp yerine taşı: dosyayı bellek eşlemeli açmış API
+        # süreçleri eski içeriği görmeye devam eder, yarım yazılmış dosya görmez
+        tmp_path = pkl_path.with_name(pkl_path.name + '.tmp')
+        with MODEL_SAVE_SECONDS.time(kernel=best_name):
+            joblib.dump((best_model, scaler), tmp_path)
+        os.replace(tmp_path, pkl_path)
 
         print(f"✅ En iyi model ({best_name}, accuracy={best_acc:.4f}) olarak kaydedildi: {pkl_path}")
+        return best_name, best_acc, pkl_path
+
+def export_linear_scorer(model, scaler, model_path):
+    """
+    Doğrusal bir model için scaler'ı ağırlıklara katlayıp küçük bir katsayı
+    dosyası (best_model_<kernel>.coef.json) yazar. Dosya, model dosyasının
+    özetini taşır; API yalnızca özet eşleşirse bu skorlayıcıyı kullanır.
+
+    Args:
+        model: coef_ ve intercept_ özelliklerine sahip eğitilmiş model
+        scaler (StandardScaler): Modelle birlikte kaydedilen scaler
+        model_path (str | Path): save_best_model_as_pickle'ın yazdığı dosya
+
+    Returns:
+        Path | None: Katsayı dosyası; model doğrusal değilse None
+    """
+    from src.models.bundle import file_digest
+
+    if not hasattr(model, 'coef_'):
+        return None
+
+    kernel = Path(model_path).stem.replace('best_model_', '')
+    scorer = LinearScorer.from_model(model, scaler, kernel, source_digest=file_digest(model_path))
+    max_error = verify_linear_scorer(scorer, model, scaler)
+
+    path = coefficient_path(model_path)
+    scorer.save(path)
+    print(f"✅ Katsayı dosyası kaydedildi (en büyük fark={max_error:.2e}): {path}")
+    return path
+
+def export_reduced_scorer(model, scaler, model_path, X_test=None, y_test=None):
+    """
+    Doğrusal olmayan bir SVC'yi az sayıda dayanak noktasına sıkıştırıp
+    best_model_<kernel>.reduced.json olarak yazar. Dosya model dosyasının
+    özetini taşır; API Config.REDUCED_SCORER açıkken bu skorlayıcıyı kullanır.
+
+    Args:
+        model: Eğitilmiş model
+        scaler (StandardScaler): Modelle birlikte kaydedilen scaler
+        model_path (str | Path): save_best_model_as_pickle'ın yazdığı dosya
+        X_test (np.ndarray): Ölçeklenmiş test özellikleri (doğruluk farkı raporu için)
+        y_test: Test etiketleri
+
+    Returns:
+        Path | None: Skorlayıcı dosyası; kapalıysa, model doğrusalsa ya da
+            yeterli uyum sağlanamadıysa None
+    """
+    from src.models.bundle import file_digest
+
+    if not Config.REDUCED_SCORER or hasattr(model, 'coef_') or not hasattr(model, 'support_vectors_'):
+        return None
+
+    scorer = compress_model(model, scaler, Config.REDUCED_MIN_AGREEMENT, source_digest=file_digest(model_path))
+    if scorer is None:
+        print("⚠️ Model yeterli uyumla sıkıştırılamadı; asıl model sunulacak.")
+        return None
+
+    if X_test is not None:
+        X_raw = np.asarray(X_test) * scaler.scale_ + scaler.mean_
+        reduced_accuracy = accuracy_score(y_test, scorer.predict_candidates(X_raw)[0])
+        scorer.report['accuracy_delta'] = float(reduced_accuracy - accuracy_score(y_test, model.predict(X_test)))
+
+    path = reduced_path(model_path)
+    scorer.save(path)
+    report = scorer.report
+    print(f"✅ Sıkıştırılmış skorlayıcı kaydedildi ({report['support_vectors']} destek vektörü -> "
+          f"{report['landmarks']} dayanak, etiket uyumu={report['agreement']:.4f}): {path}")
+    return path
 
 def predict_candidate(model, scaler, tecrube_yili, teknik_puan):
     X = np.array([[tecrube_yili, teknik_puan]])
@@ -118,14 +592,181 @@ def predict_candidate(model, scaler, tecrube_yili, teknik_puan):
     prediction = model.predict(X_scaled)[0]
     return prediction
 
+def run_training_pipeline(num_samples=None, search=None, out_of_core=None, generate=True):
+    """
+    Veri üretimi, eğitim, değerlendirme ve en iyi modelin kaydını uçtan uca çalıştırır.
+
+    API tarafından ayrı bir süreçte çağrıldığı için üst düzey bir fonksiyondur
+    ve yalnızca pickle edilebilir değerler döndürür.
+
+    Args:
+        num_samples (int): Üretilecek aday sayısı (varsayılan Config.TRAIN_NUM_SAMPLES)
+        search (bool): Paralel hiperparametre araması yapılsın mı (varsayılan Config.TRAIN_SEARCH)
+        out_of_core (bool): Bellek dışı SGD eğitimi kullanılsın mı (varsayılan Config.TRAIN_OUT_OF_CORE)
+        generate (bool): Veri yeniden üretilsin mi; False ise diskteki candidate_data.csv ile eğitilir
+
+    Returns:
+        dict: En iyi kernel, doğruluk, model dosyasının yolu, kayıt defterindeki özeti ve eğitim türü
+    """
+    from src.data.generate_data import generate_candidate_data, save_data
+
+    if num_samples is None:
+        num_samples = Config.TRAIN_NUM_SAMPLES
+    if search is None:
+        search = Config.TRAIN_SEARCH
+    if out_of_core is None:
+        out_of_core = Config.TRAIN_OUT_OF_CORE
+
+    timings = {}
+    if generate:
+        started = time.perf_counter()
+        data = generate_candidate_data(num_samples)
+        save_data(data)
+        timings['generate'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if out_of_core:
+        models, X_test, y_test, scaler = train_incremental_model()
+    else:
+        X_train, X_test, y_train, y_test, scaler = load_and_preprocess_data()
+        if search:
+            models, _ = search_svm_models(X_train, y_train, n_jobs=Config.TRAIN_N_JOBS)
+        else:
+            models = train_svm_models(X_train, y_train)
+    timings['train'] = time.perf_counter() - started
+
+    # Her model test kümesinde bir kez çalıştırılır; rapor ve model seçimi aynı sonuçları kullanır
+    started = time.perf_counter()
+    evaluations = evaluate_models(models, X_test, y_test)
+    evaluate_and_save_models(models, X_test, y_test, Config.PROJECT_ROOT / 'src/results', evaluations)
+    timings['evaluate'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    best_name, best_acc, model_path = save_best_model_as_pickle(
+        models, X_test, y_test, scaler, Config.PROJECT_ROOT / 'data', evaluations
+    )
+    export_linear_scorer(models[best_name], scaler, model_path)
+    export_reduced_scorer(models[best_name], scaler, model_path, X_test, y_test)
+    timings['save'] = time.perf_counter() - started
+
+    params = {k: v for k, v in models[best_name].get_params().items() if k in ('C', 'gamma', 'degree', 'alpha')}
+    kernels = summarize_evaluations(evaluations, len(y_test))
+    for stage, seconds in timings.items():
+        TRAINING_STAGE_SECONDS.observe(seconds, stage=stage, mode='full')
+    # İçerik özetiyle kayıt defterine ekle ve etkinleştir (tüm worker'lar işaretçiyi izler)
+    entry = register_model(model_path, best_name, metrics=dict(kernels[best_name], params=params),
+                           data_path=Config.PROJECT_ROOT / 'data/candidate_data.csv', timings=timings)
+    activate(entry['hash'])
+    return {
+        'kernel': best_name,
+        'accuracy': float(best_acc),
+        'model_path': str(model_path),
+        'model_hash': entry['hash'],
+        'params': params,
+        'mode': 'full',
+        'kernels': kernels
+    }
+
+def run_incremental_pipeline(num_new=None, seed=None, test_every=5):
+    """
+    Yeni gelen kayıtları veriye ekleyip etkin modeli bu kayıtlarla günceller.
+
+    Tüm veri yeniden üretilip baştan eğitilmez: etkin model kayıt defterinden
+    yüklenir, yeni kayıtların her test_every'inci satırı değerlendirmeye
+    ayrılır, kalanlarla incremental_update çağrılır. Etkin model yoksa tam
+    eğitime düşülür.
+
+    Args:
+        num_new (int): Eklenecek yeni aday sayısı (varsayılan Config.TRAIN_INCREMENTAL_SAMPLES)
+        seed (int): Yeni kayıtlar için tohum (varsayılan: zamana bağlı)
+        test_every (int): Yeni kayıtlardan teste ayrılacak satır aralığı
+
+    Returns:
+        dict: run_training_pipeline ile aynı alanlar, ek olarak 'train_rows'
+    """
+    from src.data.generate_data import generate_candidate_data_fast, append_data
+    from src.models.registry import read_active_model, read_manifest
+
+    active, _ = read_active_model()
+    if active is None or not os.path.exists(active['path']):
+        print("⚠️ Etkin model yok, tam eğitim yapılıyor.")
+        return run_training_pipeline()
+
+    if num_new is None:
+        num_new = Config.TRAIN_INCREMENTAL_SAMPLES
+    if seed is None:
+        seed = time.time_ns() % 2**32
+
+    timings = {}
+    started = time.perf_counter()
+    data = generate_candidate_data_fast(num_new, seed=seed)
+    append_data(data)
+    timings['generate'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    model, scaler = joblib.load(active['path'])
+    X = data[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+    y = data[LABEL_COLUMN].to_numpy()
+    is_test = _is_test_row(np.arange(len(data)), test_every)
+    train_rows = int((~is_test).sum()) + (len(model.support_) if hasattr(model, 'support_') else 0)
+    try:
+        model, scaler = incremental_update(model, scaler, X[~is_test], y[~is_test])
+    except ValueError as e:
+        # Eklenen kayıtlar kaybolmasın diye veri yeniden üretilmez; diskteki tüm veriyle eğitilir
+        print(f"⚠️ {e} Diskteki veriyle tam eğitim yapılıyor.")
+        return run_training_pipeline(generate=False)
+    timings['train'] = time.perf_counter() - started
+
+    entry = read_manifest()['models'].get(active.get('hash'), {})
+    kernel = entry.get('kernel') or ('sgd' if isinstance(model, SGDClassifier) else model.kernel)
+    X_test = scale_features(scaler, X[is_test])
+    models = {kernel: model}
+    started = time.perf_counter()
+    evaluations = evaluate_models(models, X_test, y[is_test])
+    evaluate_and_save_models(models, X_test, y[is_test], Config.PROJECT_ROOT / 'src/results', evaluations)
+    timings['evaluate'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    _, best_acc, model_path = save_best_model_as_pickle(models, X_test, y[is_test], scaler,
+                                                        Config.PROJECT_ROOT / 'data', evaluations)
+    export_linear_scorer(model, scaler, model_path)
+    export_reduced_scorer(model, scaler, model_path, X_test, y[is_test])
+    timings['save'] = time.perf_counter() - started
+
+    params = {k: v for k, v in model.get_params().items() if k in ('C', 'gamma', 'degree', 'alpha')}
+    kernels = summarize_evaluations(evaluations, int(is_test.sum()))
+    for stage, seconds in timings.items():
+        TRAINING_STAGE_SECONDS.observe(seconds, stage=stage, mode='incremental')
+    entry = register_model(model_path, kernel, metrics=dict(kernels[kernel], params=params, mode='incremental',
+                                                             parent=active.get('hash')),
+                           data_path=Config.PROJECT_ROOT / 'data/candidate_data.csv', timings=timings)
+    activate(entry['hash'])
+    return {
+        'kernel': kernel,
+        'accuracy': float(best_acc),
+        'model_path': str(model_path),
+        'model_hash': entry['hash'],
+        'params': params,
+        'mode': 'incremental',
+        'train_rows': train_rows,
+        'kernels': kernels
+    }
+
 if __name__ == "__main__":
     output_dir = Config.PROJECT_ROOT / 'src/results'
 
     X_train, X_test, y_train, y_test, scaler = load_and_preprocess_data()
     models = train_svm_models(X_train, y_train)
-    evaluate_and_save_models(models, X_test, y_test, output_dir)
+    evaluations = evaluate_and_save_models(models, X_test, y_test, output_dir)
 
-    for name, model in models.items():
-        plot_decision_boundary(model, X_train, y_train, scaler, name, output_dir)
+    # Tüm kernel'ler tek ızgarada değerlendirilir, görseller paralel çizilir (değişmeyenler atlanır)
+    from src.models.decision_plots import render_decision_boundaries
+    render_decision_boundaries(models, X_train, y_train, output_dir)
 
-    save_best_model_as_pickle(models, X_test, y_test, Config.PROJECT_ROOT / 'data')
+    best_name, best_acc, model_path = save_best_model_as_pickle(models, X_test, y_test, scaler,
+                                                                Config.PROJECT_ROOT / 'data', evaluations)
+    export_linear_scorer(models[best_name], scaler, model_path)
+    export_reduced_scorer(models[best_name], scaler, model_path, X_test, y_test)
+    entry = register_model(model_path, best_name, metrics=summarize_evaluations(evaluations, len(y_test))[best_name],
+                           data_path=Config.PROJECT_ROOT / 'data/candidate_data.csv')
+    activate(entry['hash'])
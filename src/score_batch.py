@@ -0,0 +1,306 @@
+"""
+Büyük aday dosyalarını parça parça ve çok süreçli olarak skorlar.
+
+Girdi CSV'si satır blokları halinde okunur; her blok bir worker sürecinde
+ayrıştırılır, aralık kontrolünden geçirilir ve etkin modelle skorlanır.
+Her worker modeli başlarken bir kez yükler. Sonuçlar girdi sırasıyla çıktı
+dosyasına eklenir; bellekte aynı anda en fazla 2 x worker sayısı kadar blok
+bulunur. Her bloktan sonra kontrol noktası yazılır; yarıda kalan bir çalışma
+--resume ile kaldığı yerden devam eder.
+
+Kullanım:
+    python -m src.score_batch data/candidate_data.csv data/scores.csv --workers 4
+    python -m src.score_batch data/candidate_data.csv data/scores.csv --resume
+"""
+import io
+import os
+import json
+import time
+import argparse
+import multiprocessing
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from itertools import islice
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from src.config import Config
+from src.data.feature_store import FEATURE_COLUMNS
+
+OUTPUT_COLUMNS = ['prediction', 'result', 'confidence', 'error']
+INVALID_RANGE = "Geçersiz değer aralığı! Tecrübe yılı 0-10, teknik puan 0-100 arası olmalıdır."
+
+# Worker sürecinde bir kez yüklenen model paketi
+_bundle = None
+
+
+def resolve_model(model=None):
+    """
+    Skorlamada kullanılacak modeli belirler.
+
+    Öncelik: verilen özet (ya da tekil önek), MODEL_PATH, kayıt defterindeki
+    etkin model, data/best_model_linear.joblib. Çalışma boyunca etkin model
+    değişse de tüm bloklar burada seçilen modelle skorlanır.
+
+    Returns:
+        dict: {'hash': ...} ya da {'path': ...}
+
+    Raises:
+        ValueError: Verilen özet kayıt defterinde tekil olarak eşleşmezse
+        FileNotFoundError: Hiçbir model bulunamazsa
+    """
+    from src.models import registry
+
+    if model:
+        try:
+            return {'hash': registry.resolve(model)}
+        except KeyError:
+            raise ValueError(f"Kayıt defterinde bu özetle tekil olarak eşleşen model yok: {model}")
+    if Config.MODEL_PATH:
+        return {'path': str(Config.MODEL_PATH)}
+    active, _ = registry.read_active_model()
+    if active is not None and active.get('hash'):
+        return {'hash': active['hash']}
+    if active is not None and os.path.exists(active['path']):
+        return {'path': active['path']}
+    legacy = Config.PROJECT_ROOT / 'data/best_model_linear.joblib'
+    if legacy.exists():
+        return {'path': str(legacy)}
+    raise FileNotFoundError("Skorlanacak model bulunamadı. Önce bir model eğitin ya da --model verin.")
+
+
+def _load_model(model_ref):
+    from src.models import registry
+    from src.models.bundle import load_bundle
+
+    if 'hash' in model_ref:
+        return registry.load_model(model_ref['hash'])
+    return load_bundle(model_ref['path'])
+
+
+def _init_worker(model_ref):
+    global _bundle
+    _bundle = _load_model(model_ref)
+
+
+def score_block(raw, header, columns):
+    """
+    Ham CSV satırlarından oluşan bir bloğu skorlar (worker sürecinde çalışır).
+
+    Aralık kontrolü vektörel yapılır; sayı olmayan ya da aralık dışındaki
+    satırlar skorlanmaz, error sütununda işaretlenir. Tüm girdi sütunları
+    isteniyorsa girdi satırları yeniden biçimlendirilmeden aynen yazılır,
+    yalnızca sonuç sütunları eklenir.
+
+    Args:
+        raw (bytes): Başlıksız CSV satırları
+        header (list): Girdi dosyasının sütun adları
+        columns (list): Çıktıya aktarılacak girdi sütunları
+
+    Returns:
+        tuple: (çıktı CSV baytları, satır sayısı, geçersiz satır sayısı)
+    """
+    # Boş satırlar pandas tarafından atlandığı için baştan çıkarılır (satır eşleşmesi bozulmasın)
+    lines = [line for line in raw.splitlines() if line.strip()]
+    passthrough = columns == header
+    usecols = FEATURE_COLUMNS if passthrough else list(dict.fromkeys(FEATURE_COLUMNS + columns))
+    chunk = pd.read_csv(io.BytesIO(b'\n'.join(lines)), names=header, header=None, usecols=usecols, low_memory=False)
+    tecrube = pd.to_numeric(chunk[FEATURE_COLUMNS[0]], errors='coerce').to_numpy(dtype=np.float64)
+    teknik = pd.to_numeric(chunk[FEATURE_COLUMNS[1]], errors='coerce').to_numpy(dtype=np.float64)
+    # NaN karşılaştırmaları False döner; sayı olmayan değerler de geçersiz sayılır
+    valid = (tecrube >= 0) & (tecrube <= 10) & (teknik >= 0) & (teknik <= 100)
+
+    predictions = np.zeros(len(lines), dtype=np.int64)
+    confidences = np.full(len(lines), np.nan)
+    if valid.any():
+        predictions[valid], confidences[valid] = _bundle.predict_candidates(
+            np.column_stack([tecrube[valid], teknik[valid]])
+        )
+    results = pd.DataFrame({
+        'prediction': pd.arrays.IntegerArray(predictions, ~valid),
+        'result': np.where(valid, np.where(predictions == 1, "İşe alınmaz", "İşe alınır"), None),
+        'confidence': confidences,
+        'error': np.where(valid, None, INVALID_RANGE),
+    })
+
+    prefix = lines if passthrough else chunk[columns].to_csv(index=False, header=False).encode('utf-8').splitlines()
+    suffix = results.to_csv(index=False, header=False).encode('utf-8').splitlines()
+    data = b''.join(p + b',' + s + b'\n' for p, s in zip(prefix, suffix))
+    return data, len(lines), int((~valid).sum())
+
+
+class _InlineExecutor:
+    # workers=0: bloklar ana süreçte skorlanır (hata ayıklama ve tek çekirdek için)
+    def __init__(self, model_ref):
+        _init_worker(model_ref)
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def _input_identity(path):
+    stat = os.stat(path)
+    return {'input': str(Path(path).resolve()), 'input_size': stat.st_size, 'input_mtime_ns': stat.st_mtime_ns}
+
+
+def _write_checkpoint(path, state):
+    tmp_path = Path(str(path) + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+def checkpoint_path(output_path):
+    """scores.csv -> scores.csv.checkpoint.json"""
+    return Path(str(output_path) + '.checkpoint.json')
+
+
+def score_file(input_path, output_path, chunksize=100_000, workers=None, model=None, columns=None, resume=False):
+    """
+    Girdi dosyasını skorlayıp çıktı dosyasına yazar.
+
+    Kontrol noktası, çıktıya eklenip diske yazılmış (fsync) son bloğun girdi
+    ve çıktı bayt konumlarını tutar. Devam ederken çıktı bu konuma kesilir
+    (yarım yazılmış blok atılır) ve girdi aynı konumdan okunmaya devam eder.
+    Girdi dosyası değiştiyse devam edilmez. Satır içinde satır sonu olmadığı
+    varsayılır (üretilen aday dosyalarında olduğu gibi).
+
+    Args:
+        input_path (str | Path): Girdi CSV'si (tecrube_yili ve teknik_puan sütunları zorunlu)
+        output_path (str | Path): Çıktı CSV'si
+        chunksize (int): Blok başına satır sayısı
+        workers (int): Worker süreç sayısı (varsayılan çekirdek sayısı; 0: ana süreçte)
+        model (str): Model özeti ya da öneki (varsayılan etkin model)
+        columns (list): Çıktıya aktarılacak girdi sütunları (varsayılan tümü)
+        resume (bool): Kontrol noktasından devam et
+
+    Returns:
+        dict: Satır, geçersiz satır, süre ve satır/s özeti
+
+    Raises:
+        FileExistsError: Kontrol noktası varken resume verilmezse
+        ValueError: Kontrol noktası bu girdiye ait değilse ya da gerekli sütunlar yoksa
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    output_path = Path(output_path)
+    checkpoint = checkpoint_path(output_path)
+    identity = _input_identity(input_path)
+
+    if resume and checkpoint.exists():
+        with open(checkpoint) as f:
+            state = json.load(f)
+        if {k: state.get(k) for k in identity} != identity:
+            raise ValueError("Kontrol noktası bu girdi dosyasına ait değil ya da dosya değişmiş; devam edilemez.")
+        print(f"↩️ Kaldığı yerden devam ediliyor: {state['rows']} satır skorlanmıştı.")
+    elif checkpoint.exists():
+        raise FileExistsError(f"Yarım kalmış bir çalışma var ({checkpoint}). Devam etmek için --resume kullanın "
+                              "ya da kontrol noktasını silin.")
+    else:
+        with open(input_path, 'rb') as f:
+            header_line = f.readline()
+        header = pd.read_csv(io.BytesIO(header_line), nrows=0).columns.tolist()
+        missing = [column for column in FEATURE_COLUMNS if column not in header]
+        if missing:
+            raise ValueError(f"Girdi dosyasında gerekli sütunlar yok: {missing}")
+        columns = columns or header
+        state = dict(identity, model=resolve_model(model), header=header, columns=columns,
+                     input_offset=len(header_line), output_offset=None, rows=0, invalid=0)
+
+    output_header = ','.join(state['columns'] + OUTPUT_COLUMNS) + '\n'
+    if state['output_offset'] is None:
+        with open(output_path, 'wb') as out:
+            out.write(output_header.encode('utf-8'))
+        state['output_offset'] = len(output_header.encode('utf-8'))
+        _write_checkpoint(checkpoint, state)
+
+    if workers > 0:
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_init_worker, initargs=(state['model'],))
+    else:
+        executor = _InlineExecutor(state['model'])
+
+    started = time.perf_counter()
+    rows_at_start = state['rows']
+    last_report = started
+    pending = deque()
+    try:
+        with open(input_path, 'rb') as source, open(output_path, 'r+b') as out:
+            source.seek(state['input_offset'])
+            # Yarım yazılmış bloklar atılır; kontrol noktası yalnızca tamamlanan blokları gösterir
+            out.truncate(state['output_offset'])
+            out.seek(state['output_offset'])
+
+            def write_next():
+                future, input_offset = pending.popleft()
+                data, rows, invalid = future.result()
+                out.write(data)
+                out.flush()
+                os.fsync(out.fileno())
+                state.update(input_offset=input_offset, output_offset=out.tell(),
+                             rows=state['rows'] + rows, invalid=state['invalid'] + invalid)
+                _write_checkpoint(checkpoint, state)
+
+            offset = state['input_offset']
+            while True:
+                raw = b''.join(islice(source, chunksize))
+                if not raw:
+                    break
+                offset += len(raw)
+                pending.append((executor.submit(score_block, raw, state['header'], state['columns']), offset))
+                # Bellek sınırı: en fazla 2 x worker blok aynı anda işlenir ya da yazılmayı bekler
+                while len(pending) >= max(2 * workers, 1):
+                    write_next()
+                now = time.perf_counter()
+                if now - last_report >= 5:
+                    last_report = now
+                    rate = (state['rows'] - rows_at_start) / (now - started)
+                    print(f"⏳ {state['rows']:,} satır yazıldı ({rate:,.0f} satır/s)")
+            while pending:
+                write_next()
+    except KeyboardInterrupt:
+        print(f"⛔ Yarıda kesildi; {state['rows']:,} satır yazıldı. --resume ile devam edebilirsiniz.")
+        raise
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    seconds = time.perf_counter() - started
+    checkpoint.unlink()
+    scored = state['rows'] - rows_at_start
+    summary = {
+        'rows': state['rows'],
+        'invalid': state['invalid'],
+        'seconds': seconds,
+        'rows_per_second': scored / seconds if seconds > 0 else 0.0,
+        'model': state['model'],
+    }
+    print(f"✅ {state['rows']:,} satır skorlandı ({state['invalid']:,} geçersiz); bu çalışmada {scored:,} satır "
+          f"{seconds:.2f}s'de, {summary['rows_per_second']:,.0f} satır/s: {output_path}")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', help='Girdi CSV dosyası')
+    parser.add_argument('output', help='Çıktı CSV dosyası')
+    parser.add_argument('--chunksize', type=int, default=100_000, help='Blok başına satır sayısı')
+    parser.add_argument('--workers', type=int, default=None, help='Worker süreç sayısı (0: ana süreçte)')
+    parser.add_argument('--model', help='Model özeti ya da tekil öneki (varsayılan etkin model)')
+    parser.add_argument('--columns', nargs='+', help='Çıktıya aktarılacak girdi sütunları (varsayılan tümü)')
+    parser.add_argument('--resume', action='store_true', help='Kontrol noktasından devam et')
+    args = parser.parse_args()
+
+    try:
+        score_file(args.input, args.output, args.chunksize, args.workers, args.model, args.columns, args.resume)
+    except (FileExistsError, FileNotFoundError, ValueError) as e:
+        raise SystemExit(f"❌ {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import json
 from src.config import Config
+from src.data.feature_store import read_columns
 import subprocess
 import threading
 import time
@@ -14,7 +15,8 @@ import time
 st.set_page_config(page_title="Aday Değerlendirme", page_icon="👩‍💻", layout="wide")
 
 def run_fastapi():
-    subprocess.Popen(["uvicorn", "src.api.app:app", "--host", "127.0.0.1", "--port", "8000"])
+    subprocess.Popen(["uvicorn", "src.api.app:app", "--host", "127.0.0.1", "--port", "8000",
+                      "--workers", str(Config.WEB_CONCURRENCY)])
 
 # FastAPI’yi ayrı bir thread olarak başlat (bir kez çalışsın)
 @st.cache_resource
@@ -69,8 +71,14 @@ with tab2:
         try:
             response = requests.post("http://127.0.0.1:8000/train")
             result = response.json()
-            if response.status_code == 200:
-                accuracy = result["accuracy"]
+            # Eğitim arka planda çalışır; iş bitene kadar durumunu sorgula
+            with st.spinner("Model eğitiliyor..."):
+                while response.status_code in (200, 202) and result["status"] in ("queued", "running"):
+                    time.sleep(1)
+                    response = requests.get(f"http://127.0.0.1:8000/train/{result['job_id']}")
+                    result = response.json()
+            if response.status_code in (200, 202) and result["status"] == "completed":
+                accuracy = result["metrics"]["accuracy"]
                 st.success("✅ Model başarıyla eğitildi.")
                 st.info(f"🎯 Doğruluk: `{accuracy:.2%}`")
                 fig, ax = plt.subplots()
@@ -79,7 +87,7 @@ with tab2:
                 ax.set_ylabel("Başarım")
                 st.pyplot(fig)
             else:
-                st.error(result["detail"])
+                st.error(result.get("error") or result.get("detail"))
         except Exception as e:
             st.error(f"API bağlantı hatası: {e}")
 
@@ -88,7 +96,8 @@ with tab3:
     st.subheader("📊 Örnek Veri Dağılımı ve Analizi")
 
     try:
-        df = pd.read_csv("data/candidate_data.csv")
+        # Yalnızca grafiklerde kullanılan sayısal sütunlar okunur
+        df = read_columns(Config.STATS_SOURCE, ["mezuniyet_yili", "tecrube_yili", "teknik_puan", "etiket"])
         df["etiket_label"] = df["etiket"].map({0: "İşe Alınır", 1: "İşe Alınmaz"})
 
         # Temel istatistikler